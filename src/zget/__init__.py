@@ -4,29 +4,49 @@ zget - Agentic media capture and local archival library.
 CLI and MCP front-end over yt-dlp: download, dedupe, metadata, path handoff.
 """
 
-from zget.config import (
-    DB_PATH,
-    VIDEOS_DIR,
-    ZGET_HOME,
-    detect_platform,
-    ensure_directories,
-)
-from zget.cookies import get_cookies_from_browser
-from zget.core import (
-    compute_file_hash,
-    download,
-    extract_info,
-    get_recent_videos_from_channel,
-    list_formats,
-)
-from zget.utils import get_version
-
-__version__ = get_version()
+from importlib import import_module
+
+# Public name -> submodule that defines it. Resolved on first attribute access
+# (PEP 562) so `import zget` and CLI library commands don't load yt-dlp.
+_LAZY_EXPORTS = {
+    "download": "zget.core",
+    "extract_info": "zget.core",
+    "list_formats": "zget.core",
+    "compute_file_hash": "zget.core",
+    "compute_file_hashes": "zget.core",
+    "get_recent_videos_from_channel": "zget.core",
+    "get_cookies_from_browser": "zget.cookies",
+    "ZGET_HOME": "zget.config",
+    "DB_PATH": "zget.config",
+    "VIDEOS_DIR": "zget.config",
+    "detect_platform": "zget.config",
+    "ensure_directories": "zget.config",
+}
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from zget.utils import get_version
+
+        value = get_version()
+    elif name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | {"__version__"})
+
+
 __all__ = [
     "download",
     "extract_info",
     "list_formats",
     "compute_file_hash",
+    "compute_file_hashes",
     "get_recent_videos_from_channel",
     "get_cookies_from_browser",
     "ZGET_HOME",
@@ -0,0 +1,49 @@
+"""
+JSON encode/decode for zget's own files and columns.
+
+Uses orjson when it is installed (pip install zget[fast]) and the stdlib
+json module otherwise; without orjson, decoding goes through pydantic-core's
+parser first. Output is always str, so callers don't care which.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Encode compactly, or with two-space indentation; non-JSON values become str()."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits; the stdlib handles those
+    if indent:
+        return json.dumps(obj, default=str, indent=2)
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON text."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity written by the stdlib encoder; let json accept them
+    else:
+        # pydantic is a core dependency, and its Rust parser beats the stdlib's
+        from pydantic_core import from_json
+
+        try:
+            return from_json(data)
+        except ValueError:
+            pass  # lone surrogate escapes, which only the stdlib accepts
+    return json.loads(data)
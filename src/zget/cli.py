@@ -6,167 +6,176 @@ Agent- and operator-facing entry: download, library, path health, metadata.
 
 import argparse
 import sys
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    TextColumn,
-    TimeRemainingColumn,
-    TransferSpeedColumn,
+from functools import lru_cache
+
+# Seconds per Live frame in --health; results arriving within one frame render together
+HEALTH_FRAME_INTERVAL = 0.25
+
+# (suffix, divisor) per power of 1024, for human-readable sizes
+_SIZE_UNITS = (
+    ("B", 1),
+    ("KB", 1 << 10),
+    ("MB", 1 << 20),
+    ("GB", 1 << 30),
+    ("TB", 1 << 40),
+    ("PB", 1 << 50),
 )
 
-console = Console()
-
-
-def main():
-    """Main entry point for zget CLI."""
-    parser = argparse.ArgumentParser(
-        prog="zget",
-        description="Personal media command center - download videos and manage your library.",
-    )
 
-    # URL is optional - if not provided, launch TUI
-    parser.add_argument(
+# argparse specs for the main parser: ("flags", kwargs). Slash-separated names
+# expand to short/long aliases, e.g. "-o/--output".
+_ARGS = (
+    # URL is optional - if not provided, show usage summary
+    (
         "url",
-        nargs="?",
-        default=None,
-        help="Video URL to download (if omitted, shows usage summary)",
-    )
-    parser.add_argument(
-        "-o",
-        "--output",
-        metavar="DIR",
-        help="Output directory (default: auto by platform)",
-    )
-    parser.add_argument(
-        "-a",
-        "--audio-only",
-        action="store_true",
-        help="Extract audio only",
-    )
-    parser.add_argument(
+        {
+            "nargs": "?",
+            "default": None,
+            "help": "Video URL to download (if omitted, shows usage summary)",
+        },
+    ),
+    ("-o/--output", {"metavar": "DIR", "help": "Output directory (default: auto by platform)"}),
+    ("-a/--audio-only", {"action": "store_true", "help": "Extract audio only"}),
+    (
         "--audio-format",
-        default=None,
-        choices=["mp3", "m4a", "opus", "wav", "flac"],
-        help="Audio codec to use with --audio-only (default: mp3)",
-    )
-    parser.add_argument(
-        "-q",
-        "--quality",
-        default="best",
-        help="Max video quality (default: best, or e.g., 1080, 720)",
-    )
-    parser.add_argument(
-        "-f",
-        "--format",
-        metavar="ID",
-        help="Specific format ID to download (from --list-formats)",
-    )
-    parser.add_argument(
+        {
+            "default": None,
+            "choices": ["mp3", "m4a", "opus", "wav", "flac"],
+            "help": "Audio codec to use with --audio-only (default: mp3)",
+        },
+    ),
+    (
+        "-q/--quality",
+        {"default": "best", "help": "Max video quality (default: best, or e.g., 1080, 720)"},
+    ),
+    (
+        "-f/--format",
+        {"metavar": "ID", "help": "Specific format ID to download (from --list-formats)"},
+    ),
+    (
         "--list-formats",
-        action="store_true",
-        help="List available formats for URL (don't download)",
-    )
-    parser.add_argument(
+        {"action": "store_true", "help": "List available formats for URL (don't download)"},
+    ),
+    (
         "--cookies-from",
-        metavar="BROWSER",
-        help="Extract cookies from browser (chrome, firefox, safari)",
-    )
-    parser.add_argument(
-        "--cookies",
-        metavar="FILE",
-        help="Path to cookies.txt file",
-    )
-    parser.add_argument(
-        "--quiet",
-        action="store_true",
-        help="Suppress output",
-    )
-    parser.add_argument(
-        "--search",
-        metavar="QUERY",
-        help="Search library and print results",
-    )
-    parser.add_argument(
-        "--stats",
-        action="store_true",
-        help="Show library statistics",
-    )
-    parser.add_argument(
+        {"metavar": "BROWSER", "help": "Extract cookies from browser (chrome, firefox, safari)"},
+    ),
+    ("--cookies", {"metavar": "FILE", "help": "Path to cookies.txt file"}),
+    ("--quiet", {"action": "store_true", "help": "Suppress output"}),
+    ("--search", {"metavar": "QUERY", "help": "Search library and print results"}),
+    ("--stats", {"action": "store_true", "help": "Show library statistics"}),
+    (
         "--flat",
-        action="store_true",
-        help="Use flat output structure (no platform subdirectories)",
-    )
-
+        {
+            "action": "store_true",
+            "help": "Use flat output structure (no platform subdirectories)",
+        },
+    ),
     # Capture identity: required when the URL is a media asset, not a page
-    parser.add_argument(
+    (
         "--title",
-        help="Source title, for captures that cannot report one (raw .m3u8 asset URLs)",
-    )
-    parser.add_argument(
+        {"help": "Source title, for captures that cannot report one (raw .m3u8 asset URLs)"},
+    ),
+    (
         "--source-url",
-        help="Citable page the media belongs to, when the download URL is a CDN asset",
-    )
-    parser.add_argument(
-        "--channel",
-        help="Publisher, for captures that report no uploader",
-    )
-
+        {"help": "Citable page the media belongs to, when the download URL is a CDN asset"},
+    ),
+    ("--channel", {"help": "Publisher, for captures that report no uploader"}),
     # Smokescreen Health Verification
-    parser.add_argument(
-        "--health",
-        action="store_true",
-        help="Run smokescreen health verification",
-    )
-    parser.add_argument(
-        "--proxy",
-        help="SOCKS5/HTTP proxy for health checks",
-    )
-    parser.add_argument(
-        "--location",
-        default="local",
-        help="Location identifier for health checks",
-    )
-    parser.add_argument(
+    ("--health", {"action": "store_true", "help": "Run smokescreen health verification"}),
+    ("--proxy", {"help": "SOCKS5/HTTP proxy for health checks"}),
+    ("--location", {"default": "local", "help": "Location identifier for health checks"}),
+    (
         "--all-sites",
-        action="store_true",
-        help="Verify ALL sites in registry (caution: slow)",
-    )
-
+        {"action": "store_true", "help": "Verify ALL sites in registry (caution: slow)"},
+    ),
     # Doctor (Library Health Check)
-    parser.add_argument(
+    (
         "--doctor",
-        action="store_true",
-        help="Run library health check (paths, relocatable, orphans)",
-    )
-    parser.add_argument(
+        {
+            "action": "store_true",
+            "help": "Run library health check (paths, relocatable, orphans)",
+        },
+    ),
+    (
         "--fix",
-        action="store_true",
-        help="With --doctor: rewrite stale ZGET_HOME paths (safe). "
-        "Does not delete orphans unless --purge-orphans.",
-    )
-    parser.add_argument(
+        {
+            "action": "store_true",
+            "help": "With --doctor: rewrite stale ZGET_HOME paths (safe). "
+            "Does not delete orphans unless --purge-orphans.",
+        },
+    ),
+    (
         "--purge-orphans",
-        action="store_true",
-        help="With --doctor --fix: also delete records whose media file is truly missing",
-    )
-    parser.add_argument(
+        {
+            "action": "store_true",
+            "help": "With --doctor --fix: also delete records whose media file is truly missing",
+        },
+    ),
+    (
         "--dry-run",
-        action="store_true",
-        help="Preview fixes without making changes (use with --doctor --fix)",
-    )
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Show detailed status for each item",
+        {
+            "action": "store_true",
+            "help": "Preview fixes without making changes (use with --doctor --fix)",
+        },
+    ),
+    ("--verbose", {"action": "store_true", "help": "Show detailed status for each item"}),
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the main zget argument parser from _ARGS."""
+    parser = argparse.ArgumentParser(
+        prog="zget",
+        description="Personal media command center - download videos and manage your library.",
     )
+    add = parser.add_argument
+    for flags, kwargs in _ARGS:
+        add(*flags.split("/"), **kwargs)
+    return parser
+
+
+def _arg_dest(flags: str) -> str:
+    """Namespace attribute argparse would derive for a _ARGS flag spec."""
+    name = flags.split("/")[-1]
+    return name.lstrip("-").replace("-", "_")
+
+
+# Parser output when no arguments are given, and the store_true switches by flag
+_ARG_DEFAULTS = {
+    _arg_dest(flags): False if kwargs.get("action") == "store_true" else kwargs.get("default")
+    for flags, kwargs in _ARGS
+}
+_SWITCH_DESTS = {
+    flag: _arg_dest(flags)
+    for flags, kwargs in _ARGS
+    if kwargs.get("action") == "store_true"
+    for flag in flags.split("/")
+}
+
+
+def _parse_switches(argv: list[str]) -> argparse.Namespace | None:
+    """Parse argv without argparse when it holds only on/off switches.
+
+    Covers bare ``zget``, ``--stats``, ``--doctor --fix`` and the like; returns
+    None for anything with a value, a URL or an unknown flag (incl. --help).
+    """
+    values = dict(_ARG_DEFAULTS)
+    for arg in argv:
+        dest = _SWITCH_DESTS.get(arg)
+        if dest is None:
+            return None
+        values[dest] = True
+    return argparse.Namespace(**values)
+
+
+def main():
+    """Main entry point for zget CLI."""
+    argv = sys.argv[1:]
 
     # Special handling for subcommands before general parsing
     # This avoids conflicts with the positional 'url' argument
-    if len(sys.argv) > 1 and sys.argv[1] == "config":
+    if argv and argv[0] == "config":
         from zget.commands.config import handle_config
 
         config_parser = argparse.ArgumentParser(
@@ -181,23 +190,28 @@ def main():
         )
         config_parser.add_argument("config_params", nargs="*", help="Config key and optional value")
 
-        config_args = config_parser.parse_args(sys.argv[2:])
+        config_args = config_parser.parse_args(argv[1:])
         handle_config(config_args)
         return
 
-    if len(sys.argv) > 1 and sys.argv[1] == "info":
-        handle_info_cmd(sys.argv[2:])
+    if argv and argv[0] == "info":
+        handle_info_cmd(argv[1:])
         return
 
-    if len(sys.argv) > 1 and sys.argv[1] in ("list-channel", "ls-channel"):
-        handle_list_channel_cmd(sys.argv[2:])
+    if argv and argv[0] in ("list-channel", "ls-channel"):
+        handle_list_channel_cmd(argv[1:])
         return
 
-    if len(sys.argv) > 1 and sys.argv[1] == "paths":
-        handle_paths_cmd(sys.argv[2:])
+    if argv and argv[0] == "paths":
+        handle_paths_cmd(argv[1:])
         return
 
-    args = parser.parse_args()
+    # Bare library queries skip building the full parser
+    if len(argv) == 2 and argv[0] == "--search" and not argv[1].startswith("-"):
+        handle_search(argv[1])
+        return
+
+    args = _parse_switches(argv) or build_parser().parse_args(argv)
 
     # Handle non-download commands first
     if args.health:
@@ -232,13 +246,34 @@ def main():
     handle_download(args)
 
 
+@lru_cache(maxsize=1)
+def _get_console():
+    """Create the shared Rich console on first output, not at import."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _get_store():
+    """Open the library once per process; every handler shares the store."""
+    from zget.config import DB_PATH
+    from zget.db import VideoStore
+
+    return VideoStore(DB_PATH)
+
+
 async def handle_health(args):
     """Handle smokescreen health verification from CLI."""
+    import asyncio
+
     from rich.live import Live
     from rich.table import Table
 
     from zget.health import SiteHealth
 
+    console = _get_console()
+
     health = SiteHealth()
     # Ensure metadata is loaded
     await health.sync()
@@ -256,11 +291,18 @@ async def handle_health(args):
     table.add_column("Latency")
     table.add_column("Details")
 
-    all_results = []
-    with Live(table, console=console, refresh_per_second=4):
+    # Completions land in `pending`; the first one of a batch wakes the flusher,
+    # which waits one frame so results arriving together render together
+    pending = []
+    arrived = asyncio.Event()
+
+    def on_result(result):
+        pending.append(result)
+        arrived.set()
 
-        def on_result(r):
-            all_results.append(r)
+    def add_pending_rows():
+        rows, pending[:] = pending[:], []
+        for r in rows:
             status_color = (
                 "green" if r.status == "ok" else "yellow" if r.status == "geo_blocked" else "red"
             )
@@ -271,13 +313,28 @@ async def handle_health(args):
                 r.error or "-",
             )
 
-        await health.run_smokescreen(
-            sites=sites, proxy=args.proxy, tested_from=args.location, on_result=on_result
-        )
+    async def flush_rows(live):
+        while True:
+            await arrived.wait()
+            await asyncio.sleep(HEALTH_FRAME_INTERVAL)
+            arrived.clear()
+            add_pending_rows()
+            live.refresh()
+
+    # No auto-refresh thread: the table only re-renders when rows were added
+    with Live(table, console=console, auto_refresh=False) as live:
+        flusher = asyncio.create_task(flush_rows(live))
+        try:
+            # run_smokescreen persists the health log itself
+            all_results = await health.run_smokescreen(
+                sites=sites, proxy=args.proxy, tested_from=args.location, on_result=on_result
+            )
+        finally:
+            flusher.cancel()
+        add_pending_rows()
+        live.refresh()
 
-    # Persist results after verification
     if all_results:
-        health.save_health_log(all_results)
         console.print(
             f"\n[bold green]✓[/bold green] Saved {len(all_results)} verification results."
         )
@@ -285,8 +342,12 @@ async def handle_health(args):
 
 def show_welcome():
     """Show CLI / agent usage when no URL is given."""
+    from rich.panel import Panel
+
     from zget.utils import get_version
 
+    console = _get_console()
+
     console.print(
         Panel(
             f"[bold]zget v{get_version()}[/bold]\n\n"
@@ -318,6 +379,8 @@ def handle_info_cmd(argv: list[str]) -> None:
 
     from zget.core import extract_info
 
+    console = _get_console()
+
     p = argparse.ArgumentParser(
         prog="zget info",
         description="Extract media metadata without downloading.",
@@ -386,6 +449,8 @@ def handle_list_channel_cmd(argv: list[str]) -> None:
 
     from zget.core import get_recent_videos_from_channel
 
+    console = _get_console()
+
     p = argparse.ArgumentParser(
         prog="zget list-channel",
         description="List videos from a channel, playlist, or tab (metadata only).",
@@ -468,12 +533,24 @@ def handle_list_channel_cmd(argv: list[str]) -> None:
 
 def handle_download(args):
     """Handle direct download from CLI."""
+    from concurrent.futures import ThreadPoolExecutor
     from datetime import datetime
     from pathlib import Path
 
-    from zget.config import DB_PATH, detect_platform, ensure_directories, get_video_output_dir
-    from zget.core import compute_file_hash, download, parse_upload_date
-    from zget.db import Video, VideoStore
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TextColumn,
+        TimeRemainingColumn,
+        TransferSpeedColumn,
+    )
+
+    from zget.config import detect_platform, ensure_directories, get_video_output_dir
+    from zget.core import download, parse_upload_date, storage_metadata
+    from zget.db import Video
+
+    console = _get_console()
 
     ensure_directories()
 
@@ -497,30 +574,37 @@ def handle_download(args):
         config.FLAT_OUTPUT_STRUCTURE = original_flat
 
     try:
-        with Progress(
+        # ETA is the costliest column to recompute per refresh; show it on request
+        columns = [
             TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
+            BarColumn(bar_width=30),
             DownloadColumn(),
             TransferSpeedColumn(),
-            TimeRemainingColumn(),
+        ]
+        if getattr(args, "verbose", False):
+            columns.append(TimeRemainingColumn())
+
+        with Progress(
+            *columns,
             console=console,
             disable=args.quiet,
+            refresh_per_second=10,
+            transient=True,
         ) as progress:
             task_id = progress.add_task("Downloading...", total=None)
 
-            def progress_callback(d):
-                if d["status"] == "downloading":
-                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
-                    downloaded = d.get("downloaded_bytes", 0)
-
+            # core.download already coalesces yt-dlp's per-chunk hooks to ~10 Hz
+            def progress_callback(d, _update=progress.update, _task=task_id):
+                status = d["status"]
+                if status == "downloading":
+                    total = d["total_bytes"]
+                    downloaded = d["downloaded_bytes"]
                     if total:
-                        progress.update(task_id, completed=downloaded, total=total)
+                        _update(_task, completed=downloaded, total=total)
                     else:
-                        progress.update(
-                            task_id, description=f"Downloading... {downloaded // 1024} KB"
-                        )
-                elif d["status"] == "finished":
-                    progress.update(task_id, description="Processing...")
+                        _update(_task, description=f"Downloading... {downloaded // 1024} KB")
+                elif status == "finished":
+                    _update(_task, description="Processing...")
 
             result = download(
                 url=args.url,
@@ -544,107 +628,81 @@ def handle_download(args):
         from zget.config import THUMBNAILS_DIR
         from zget.library.thumbnails import cache_thumbnail_sync
 
-        store = VideoStore(DB_PATH)
-
-        for item in all_results:
-            # Get filepath and compute hash
-            filepath = Path(item.get("_zget_filepath", ""))
-            if filepath.exists():
-                file_hash = compute_file_hash(filepath)
-                file_size = filepath.stat().st_size
-            else:
-                file_hash = None
-                file_size = None
-
-            thumbnail_path = cache_thumbnail_sync(item, THUMBNAILS_DIR)
-
-            video = Video(
-                url=item.get("original_url") or item.get("webpage_url") or args.url,
-                platform=platform,
-                video_id=item.get("id", ""),
-                title=item.get("title", "Untitled"),
-                description=item.get("description"),
-                uploader=(
-                    "C-SPAN"
-                    if platform == "c-span"
-                    and (
-                        not item.get("uploader")
-                        or item.get("uploader", "").lower() in ("unknown", "null", "none")
-                    )
-                    else item.get("uploader", "unknown")
-                ),
-                uploader_id=item.get("uploader_id"),
-                upload_date=parse_upload_date(item.get("upload_date")),
-                duration_seconds=item.get("duration"),
-                view_count=item.get("view_count"),
-                like_count=item.get("like_count"),
-                resolution=f"{item.get('width', '?')}x{item.get('height', '?')}",
-                fps=item.get("fps"),
-                codec=item.get("vcodec"),
-                file_size_bytes=file_size,
-                file_hash_sha256=file_hash,
-                local_path=str(filepath) if filepath.exists() else None,
-                thumbnail_path=str(thumbnail_path) if thumbnail_path else None,
-                downloaded_at=datetime.now(),
-                raw_metadata=item,
-            )
-
-            try:
-                video.id = store.insert_video(video)
-                if not args.quiet:
-                    console.print(f"[green]✓[/green] Added to library: {video.title}")
-
-                # Sidecars: NFO (Plex) + librarian.json (provenance; also written in core)
-                if filepath.exists():
-                    try:
-                        import shutil
+        store = _get_store()
+
+        # Hashing, thumbnail fetches and sidecar writes overlap on worker threads;
+        # this thread only builds records and talks to SQLite
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            hash_jobs = [pool.submit(_hash_media, item) for item in all_results]
+            thumb_jobs = [
+                pool.submit(cache_thumbnail_sync, item, THUMBNAILS_DIR) for item in all_results
+            ]
+            sidecar_jobs = []
+
+            for item, hash_job, thumb_job in zip(all_results, hash_jobs, thumb_jobs):
+                filepath = Path(item.get("_zget_filepath", ""))
+                file_hash, file_size = hash_job.result()
+                thumbnail_path = thumb_job.result()
+
+                video = Video(
+                    url=item.get("original_url") or item.get("webpage_url") or args.url,
+                    platform=platform,
+                    video_id=item.get("id", ""),
+                    title=item.get("title", "Untitled"),
+                    description=item.get("description"),
+                    uploader=(
+                        "C-SPAN"
+                        if platform == "c-span"
+                        and (
+                            not item.get("uploader")
+                            or item.get("uploader", "").lower() in ("unknown", "null", "none")
+                        )
+                        else item.get("uploader", "unknown")
+                    ),
+                    uploader_id=item.get("uploader_id"),
+                    upload_date=parse_upload_date(item.get("upload_date")),
+                    duration_seconds=item.get("duration"),
+                    view_count=item.get("view_count"),
+                    like_count=item.get("like_count"),
+                    resolution=f"{item.get('width', '?')}x{item.get('height', '?')}",
+                    fps=item.get("fps"),
+                    codec=item.get("vcodec"),
+                    file_size_bytes=file_size,
+                    file_hash_sha256=file_hash,
+                    local_path=str(filepath) if file_size is not None else None,
+                    thumbnail_path=str(thumbnail_path) if thumbnail_path else None,
+                    downloaded_at=datetime.now(),
+                    raw_metadata=storage_metadata(item),
+                )
 
-                        from zget.metadata.librarian_json import (
-                            generate_librarian_json_from_info,
+                # Inserted inline, not deferred: sidecars are only written for
+                # records that made it into the library, and the "Added" line or
+                # the warning below is printed per item. A failed insert only
+                # warns; the exit status reflects the download, not the library.
+                try:
+                    video.id = store.insert_video(video)
+                    if not args.quiet:
+                        console.print(f"[green]✓[/green] Added to library: {video.title}")
+
+                    # Sidecars: NFO (Plex) + librarian.json (provenance; also written in core)
+                    if file_size is not None:
+                        sidecar_jobs.append(
+                            pool.submit(_write_sidecars, video, item, filepath, platform, file_hash)
                         )
-                        from zget.metadata.nfo import generate_nfo
-
-                        # Generate NFO
-                        nfo_path = filepath.with_suffix(".nfo")
-                        generate_nfo(video, nfo_path)
-
-                        # Enrich / rewrite librarian.json with final DB-backed fields
-                        side_info = dict(item)
-                        side_info["title"] = video.title
-                        side_info["uploader"] = video.uploader
-                        side_info["_zget_platform"] = platform
-                        if video.upload_date:
-                            side_info["upload_date"] = video.upload_date.strftime(
-                                "%Y%m%d"
-                            )
-                        generate_librarian_json_from_info(
-                            filepath,
-                            side_info,
-                            sha256=file_hash,
+
+                except Exception as e:
+                    if not args.quiet:
+                        console.print(
+                            f"[yellow]⚠[/yellow] Downloaded but not added to library: {e}"
                         )
 
-                        # Copy thumbnail to video directory
-                        if video.thumbnail_path:
-                            thumb_src = Path(video.thumbnail_path)
-                            if thumb_src.exists():
-                                local_thumb = filepath.with_suffix(thumb_src.suffix)
-                                if not local_thumb.exists():
-                                    shutil.copy2(thumb_src, local_thumb)
-                    except Exception as nfo_error:
-                        if not args.quiet:
-                            console.print(
-                                f"[yellow]⚠[/yellow] Sidecar generation failed: {nfo_error}"
-                            )
-
-            except Exception as e:
                 if not args.quiet:
-                    console.print(
-                        f"[yellow]⚠[/yellow] Downloaded but not added to library: {e}"
-                    )
+                    console.print(f"[green]✓[/green] Downloaded: {item.get('title', 'video')}")
+                    console.print(f"  → {filepath}")
 
-            if not args.quiet:
-                console.print(f"[green]✓[/green] Downloaded: {item.get('title', 'video')}")
-                console.print(f"  → {filepath}")
+        for job in sidecar_jobs:
+            if (nfo_error := job.exception()) is not None and not args.quiet:
+                console.print(f"[yellow]⚠[/yellow] Sidecar generation failed: {nfo_error}")
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Download cancelled[/yellow]")
@@ -654,12 +712,67 @@ def handle_download(args):
         sys.exit(1)
 
 
+def _write_sidecars(video, item: dict, filepath, platform: str, file_hash: str | None) -> None:
+    """Write the NFO, final librarian.json and local thumbnail copy next to the media."""
+    import shutil
+    from pathlib import Path
+
+    from zget.metadata.librarian_json import generate_librarian_json_from_info
+    from zget.metadata.nfo import generate_nfo
+
+    # Generate NFO
+    nfo_path = filepath.with_suffix(".nfo")
+    generate_nfo(video, nfo_path)
+
+    # Enrich / rewrite librarian.json with final DB-backed fields
+    side_info = dict(item)
+    side_info["title"] = video.title
+    side_info["uploader"] = video.uploader
+    side_info["_zget_platform"] = platform
+    if video.upload_date:
+        side_info["upload_date"] = video.upload_date.strftime("%Y%m%d")
+    generate_librarian_json_from_info(filepath, side_info, sha256=file_hash)
+
+    # Copy thumbnail to video directory
+    if video.thumbnail_path:
+        thumb_src = Path(video.thumbnail_path)
+        if thumb_src.exists():
+            local_thumb = filepath.with_suffix(thumb_src.suffix)
+            if not local_thumb.exists():
+                shutil.copy2(thumb_src, local_thumb)
+
+
+def _hash_media(item: dict) -> tuple[str | None, int | None]:
+    """SHA-256 and size of a downloaded file; reuses the hash core took for the sidecar.
+
+    Returns (None, None) when the file is missing. One stat() answers both
+    "does it exist" and "how big is it".
+    """
+    import os
+
+    from zget.core import compute_file_hash
+
+    filepath = item.get("_zget_filepath")
+    if not filepath:
+        return None, None
+    try:
+        size = os.stat(filepath).st_size
+    except OSError:
+        return None, None
+    file_hash = item.get("_zget_file_hash_sha256") or compute_file_hash(filepath)
+    return file_hash, size
+
+
 def handle_list_formats(args):
     """List available formats for a URL."""
+    from operator import itemgetter
+
     from rich.table import Table
 
     from zget.core import list_formats
 
+    console = _get_console()
+
     try:
         console.print(f"[dim]Fetching formats for: {args.url}[/dim]\n")
 
@@ -669,30 +782,36 @@ def handle_list_formats(args):
             cookies_file=args.cookies,
         )
 
+        # list_formats emits every key on every format, so one C-level getter
+        # unpacks a row instead of nine .get() calls
+        fields = itemgetter(
+            "format_id", "ext", "resolution", "fps", "vcodec", "acodec", "has_video", "has_audio"
+        )
+        rows = [
+            (
+                fid or "?",
+                ext or "?",
+                res or "?",
+                str(fps) if fps else "",
+                vcodec or "-" if has_video else "-",
+                acodec or "-" if has_audio else "-",
+                _format_size(size, min_unit=2) if (size := f["filesize"]) else "",
+            )
+            for f in formats
+            for fid, ext, res, fps, vcodec, acodec, has_video, has_audio in (fields(f),)
+        ]
+
+        # Short fixed-vocabulary columns never wrap, so Rich skips reflowing them
         table = Table(title="Available Formats")
-        table.add_column("ID", style="cyan")
-        table.add_column("Ext", style="green")
-        table.add_column("Resolution")
-        table.add_column("FPS")
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Ext", style="green", no_wrap=True)
+        table.add_column("Resolution", no_wrap=True)
+        table.add_column("FPS", no_wrap=True)
         table.add_column("Video")
         table.add_column("Audio")
-        table.add_column("Size", justify="right")
-
-        for f in formats:
-            size = ""
-            if f.get("filesize"):
-                size_mb = f["filesize"] / (1024 * 1024)
-                size = f"{size_mb:.1f} MB"
-
-            table.add_row(
-                f.get("format_id", "?"),
-                f.get("ext", "?"),
-                f.get("resolution", "?"),
-                str(f.get("fps", "")) if f.get("fps") else "",
-                f.get("vcodec", "-") if f.get("has_video") else "-",
-                f.get("acodec", "-") if f.get("has_audio") else "-",
-                size,
-            )
+        table.add_column("Size", justify="right", no_wrap=True)
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
         console.print("\n[dim]Use -f FORMAT_ID to download a specific format[/dim]")
@@ -706,17 +825,12 @@ def handle_search(query: str):
     """Search library and print results."""
     from rich.table import Table
 
-    from zget.config import DB_PATH, PLATFORM_DISPLAY, ensure_directories
-    from zget.db import VideoStore
+    from zget.config import PLATFORM_DISPLAY, ensure_directories
 
-    ensure_directories()
-    store = VideoStore(DB_PATH)
+    console = _get_console()
 
-    videos = store.search(query, limit=50)
-
-    if not videos:
-        console.print(f"[yellow]No results for: {query}[/yellow]")
-        return
+    ensure_directories()
+    store = _get_store()
 
     table = Table(title=f"Search Results: '{query}'")
     table.add_column("Platform", style="cyan")
@@ -724,22 +838,16 @@ def handle_search(query: str):
     table.add_column("Title")
     table.add_column("Duration", justify="right")
 
-    for v in videos:
-        duration = ""
-        if v.duration_seconds:
-            mins, secs = divmod(int(v.duration_seconds), 60)
-            duration = f"{mins}:{secs:02d}"
-
-        platform_name = PLATFORM_DISPLAY.get(v.platform, v.platform.capitalize())
-        table.add_row(
-            platform_name,
-            v.uploader[:15] if v.uploader else "?",
-            v.title[:40] if v.title else "?",
-            duration,
-        )
+    for platform, uploader, title, duration in store.search_summary(query, limit=50):
+        platform_name = PLATFORM_DISPLAY.get(platform, platform.capitalize())
+        table.add_row(platform_name, uploader, title, duration)
+
+    if not table.row_count:
+        console.print(f"[yellow]No results for: {query}[/yellow]")
+        return
 
     console.print(table)
-    console.print(f"\n[dim]{len(videos)} result(s)[/dim]")
+    console.print(f"\n[dim]{table.row_count} result(s)[/dim]")
 
 
 def handle_stats():
@@ -748,26 +856,19 @@ def handle_stats():
     from rich.table import Table
 
     from zget.config import (
-        DB_PATH,
         PLATFORM_DISPLAY,
         VIDEOS_DIR,
         ensure_directories,
     )
-    from zget.db import VideoStore
+
+    console = _get_console()
 
     ensure_directories()
-    store = VideoStore(DB_PATH)
+    store = _get_store()
 
     stats = store.get_stats()
 
-    # Format size
-    size_bytes = stats["total_size_bytes"]
-    if size_bytes < 1024 * 1024:
-        size_str = f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        size_str = f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    size_str = _format_size(stats["total_size_bytes"], min_unit=1)
 
     # Platform breakdown
     table = Table(show_header=False, box=None)
@@ -799,13 +900,14 @@ def handle_paths_cmd(argv: list[str]) -> None:
     from rich.panel import Panel
 
     from zget.config import DB_PATH, ZGET_HOME, ensure_directories
-    from zget.db import VideoStore
     from zget.library.paths import (
         DEFAULT_LEGACY_HOME,
         assess_library,
         rewrite_stale_paths,
     )
 
+    console = _get_console()
+
     p = argparse.ArgumentParser(
         prog="zget paths",
         description="Inspect or rewrite library media paths after ZGET_HOME moves.",
@@ -838,7 +940,7 @@ def handle_paths_cmd(argv: list[str]) -> None:
     args = p.parse_args(argv)
 
     ensure_directories()
-    store = VideoStore(DB_PATH)
+    store = _get_store()
     legacy = [Path(args.legacy_from).expanduser()]
     console.print(
         Panel(
@@ -852,7 +954,7 @@ def handle_paths_cmd(argv: list[str]) -> None:
 
     if args.action == "check":
         report = assess_library(
-            store.list_all_videos(), current_home=ZGET_HOME, legacy_homes=legacy
+            store.iter_all_videos(), current_home=ZGET_HOME, legacy_homes=legacy
         )
         _print_path_report(report, verbose=True)
         return
@@ -891,6 +993,8 @@ def _print_path_report(report, *, verbose: bool) -> None:
 
     from zget.library.paths import PathStatus
 
+    console = _get_console()
+
     console.print(
         f"\n  Healthy:         [green]{len(report.healthy)}[/green]\n"
         f"  Relocatable:     [yellow]{len(report.relocatable)}[/yellow]  "
@@ -935,7 +1039,6 @@ def handle_doctor(args):
     from rich.table import Table
 
     from zget.config import DB_PATH, THUMBNAILS_DIR, ZGET_HOME, ensure_directories
-    from zget.db import VideoStore
     from zget.library.paths import (
         PathStatus,
         assess_library,
@@ -945,8 +1048,10 @@ def handle_doctor(args):
     )
     from zget.safe_delete import TRASH_AVAILABLE, safe_delete
 
+    console = _get_console()
+
     ensure_directories()
-    store = VideoStore(DB_PATH)
+    store = _get_store()
 
     console.print(
         Panel(
@@ -956,11 +1061,10 @@ def handle_doctor(args):
         )
     )
 
-    videos = store.list_all_videos()
-    total_records = len(videos)
+    total_records = store.count_videos()
     console.print(f"\n[dim]Scanning {total_records} records...[/dim]\n")
 
-    report = assess_library(videos, current_home=ZGET_HOME)
+    report = assess_library(store.iter_all_videos(), current_home=ZGET_HOME)
     relocatable = report.relocatable
     orphans = report.orphans
     off_home = report.off_home
@@ -1023,15 +1127,12 @@ def handle_doctor(args):
             table.add_column("ID", style="cyan")
             table.add_column("Title")
             table.add_column("Former Path", style="dim")
-            for a in orphans[:20]:
-                v = a.video
-                table.add_row(
-                    str(v.id),
-                    (v.title[:40] + "...") if len(v.title or "") > 40 else (v.title or "?"),
-                    (v.local_path[:50] + "...")
-                    if v.local_path and len(v.local_path) > 50
-                    else (v.local_path or "?"),
-                )
+            rows = [
+                (str(a.video.id), _ellipsis(a.video.title, 40), _ellipsis(a.video.local_path, 50))
+                for a in orphans[:20]
+            ]
+            for row in rows:
+                table.add_row(*row)
             if len(orphans) > 20:
                 table.add_row("...", f"({len(orphans) - 20} more)", "...")
             console.print(table)
@@ -1102,16 +1203,25 @@ def handle_doctor(args):
     )
 
 
-def _format_size(size_bytes: int) -> str:
-    """Format bytes to human readable string."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+def _ellipsis(text: str | None, width: int) -> str:
+    """Cut text to width characters plus "...", or "?" when missing."""
+    if not text:
+        return "?"
+    return text[:width] + "..." if len(text) > width else text
+
+
+def _format_size(size_bytes: float, min_unit: int = 0) -> str:
+    """Format bytes to human readable string, in the largest unit that fits.
+
+    min_unit floors the unit (1 = KB, 2 = MB) for columns that read better
+    without tiny byte counts.
+    """
+    # bit_length // 10 is floor(log1024), i.e. the index into _SIZE_UNITS
+    index = max(min_unit, min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1))
+    unit, divisor = _SIZE_UNITS[index]
+    if index == 0:
+        return f"{int(size_bytes)} {unit}"
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
 if __name__ == "__main__":
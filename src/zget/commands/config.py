@@ -4,7 +4,8 @@ import sys
 from rich.console import Console
 from rich.table import Table
 
-from zget.config import CONFIG_DIR, CONFIG_FILE
+from zget import _json
+from zget.config import CONFIG_DIR, CONFIG_FILE, read_persistent_config
 
 console = Console()
 
@@ -40,8 +41,7 @@ def show_config():
         return
 
     try:
-        with open(CONFIG_FILE) as f:
-            config = json.load(f)
+        config = read_persistent_config()
     except Exception as e:
         console.print(f"[red]Error reading config: {e}[/red]")
         return
@@ -87,16 +87,14 @@ def set_config(key, value):
     config = {}
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE) as f:
-                config = json.load(f)
+            config = read_persistent_config()
         except (json.JSONDecodeError, FileNotFoundError, OSError) as e:
             console.print(f"[yellow]Warning: could not read existing config: {e}[/yellow]")
 
     config[config_key] = typed_value
 
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=4)
+    CONFIG_FILE.write_text(_json.dumps(config, indent=True), encoding="utf-8")
 
     console.print(f"[green]✓[/green] Set [cyan]{config_key}[/cyan] to [green]{typed_value}[/green]")
 
@@ -107,16 +105,14 @@ def unset_config(key):
         return
 
     try:
-        with open(CONFIG_FILE) as f:
-            config = json.load(f)
+        config = read_persistent_config()
     except (json.JSONDecodeError, FileNotFoundError, OSError) as e:
         console.print(f"[yellow]Warning: could not read config: {e}[/yellow]")
         return
 
     if key in config:
         del config[key]
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
+        CONFIG_FILE.write_text(_json.dumps(config, indent=True), encoding="utf-8")
         console.print(f"[green]✓[/green] Unset [cyan]{key}[/cyan]")
     else:
         # Check mapped keys too
@@ -128,8 +124,7 @@ def unset_config(key):
         mapped_key = key_map.get(key)
         if mapped_key and mapped_key in config:
             del config[mapped_key]
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=4)
+            CONFIG_FILE.write_text(_json.dumps(config, indent=True), encoding="utf-8")
             console.print(f"[green]✓[/green] Unset [cyan]{mapped_key}[/cyan]")
         else:
             console.print(f"[yellow]Key not found: {key}[/yellow]")
@@ -4,10 +4,14 @@ zget configuration module.
 Central configuration for all paths and settings.
 """
 
-import json
 import os
-import platform
+import sys
+from collections.abc import Callable
+from functools import cache, lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
+
+from . import _json
 
 # ============================================================================
 # BROWSER DETECTION
@@ -21,7 +25,7 @@ def detect_installed_browser() -> str | None:
     Returns the first browser found, or None if no supported browser is installed.
     Priority order: Chrome, Brave, Firefox, Edge, Chromium, Opera, Vivaldi
     """
-    if platform.system() == "Darwin":  # macOS
+    if sys.platform == "darwin":  # macOS
         browser_paths = {
             "chrome": Path.home() / "Library/Application Support/Google/Chrome",
             "brave": Path.home() / "Library/Application Support/BraveSoftware/Brave-Browser",
@@ -31,7 +35,7 @@ def detect_installed_browser() -> str | None:
             "opera": Path.home() / "Library/Application Support/com.operasoftware.Opera",
             "vivaldi": Path.home() / "Library/Application Support/Vivaldi",
         }
-    elif platform.system() == "Windows":
+    elif sys.platform == "win32":
         local_app_data = Path(os.environ.get("LOCALAPPDATA", ""))
         app_data = Path(os.environ.get("APPDATA", ""))
         browser_paths = {
@@ -74,14 +78,29 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 # config key zget_home (see README "Library location").
 
 
+# (st_mtime_ns, st_size) -> parsed config.json, so repeat loads skip the parse
+_config_cache: dict[tuple[int, int], dict] = {}
+
+
+def read_persistent_config() -> dict:
+    """Parse config.json, reusing the previous parse while the file is unchanged.
+
+    Raises OSError if the file can't be read and ValueError if it isn't JSON.
+    """
+    st = CONFIG_FILE.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if key not in _config_cache:
+        config = _json.loads(CONFIG_FILE.read_bytes()) if st.st_size else {}
+        _config_cache.clear()
+        _config_cache[key] = config
+    return dict(_config_cache[key])
+
+
 def load_persistent_config():
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    try:
+        return read_persistent_config()
+    except Exception:
+        return {}
 
 
 PERSISTENT_CONFIG = load_persistent_config()
@@ -132,14 +151,22 @@ FILENAME_TEMPLATE_SAFE = "%(upload_date)s_%(uploader)s_%(title)s.%(ext)s"
 _custom_output_raw = os.getenv("ZGET_OUTPUT_DIR", PERSISTENT_CONFIG.get("output_dir", None))
 CUSTOM_OUTPUT_DIR: Path | None = Path(_custom_output_raw) if _custom_output_raw else None
 
+# Env var values that switch a boolean setting on
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 # Use flat structure (no platform subdirectories)
 # Default: False (organize by platform)
 # When True, all videos go in one folder regardless of platform
-FLAT_OUTPUT_STRUCTURE = os.getenv("ZGET_FLAT_OUTPUT", "").lower() in (
-    "1",
-    "true",
-    "yes",
-) or PERSISTENT_CONFIG.get("flat_output", False)
+FLAT_OUTPUT_STRUCTURE = os.getenv("ZGET_FLAT_OUTPUT", "").strip().lower() in _TRUTHY or bool(
+    PERSISTENT_CONFIG.get("flat_output", False)
+)
+
+# Hand plain HTTP(S) media downloads to aria2c (16 connections per file) when
+# it is on PATH. Opt-in: ZGET_ARIA2C=1 or config.json "aria2c": true.
+# HLS/DASH stay on yt-dlp's native fragment downloader.
+USE_ARIA2C = os.getenv("ZGET_ARIA2C", "").strip().lower() in _TRUTHY or bool(
+    PERSISTENT_CONFIG.get("aria2c", False)
+)
 
 # Custom filename template (yt-dlp format)
 # Default uses existing FILENAME_TEMPLATE_SAFE
@@ -172,11 +199,23 @@ CHECK_INTERVAL_JITTER = 0.10
 # ============================================================================
 
 # Default browser for cookie extraction (for logged-in sessions)
-# Auto-detects first available browser, or can be set via config/env
-_detected_browser = detect_installed_browser()
-DEFAULT_COOKIE_BROWSER = os.getenv(
-    "ZGET_COOKIE_BROWSER", PERSISTENT_CONFIG.get("cookie_browser", _detected_browser)
-)
+# Auto-detects first available browser, or can be set via config/env.
+# DEFAULT_COOKIE_BROWSER and BROWSER_APP (below) are resolved on first access
+# (see __getattr__), so importing config doesn't stat browser profile dirs.
+
+
+@cache
+def _detected_browser() -> str | None:
+    return detect_installed_browser()
+
+
+def _env_or_config(env_var: str, key: str, fallback: Callable[[], str | None]) -> str | None:
+    """os.getenv(env_var, PERSISTENT_CONFIG.get(key, fallback())), but fallback() runs last."""
+    value = os.getenv(env_var)
+    if value is None:
+        value = PERSISTENT_CONFIG[key] if key in PERSISTENT_CONFIG else fallback()
+    return value
+
 
 # Per-platform browser preferences (can be overridden)
 PLATFORM_COOKIE_BROWSERS: dict[str, str] = {}
@@ -185,12 +224,28 @@ PLATFORM_COOKIE_BROWSERS: dict[str, str] = {}
 # BROWSER SETTINGS (for opening URLs)
 # ============================================================================
 
-# Browser application to use for opening URLs
+# Browser application to use for opening URLs (BROWSER_APP, resolved lazily)
 # Options: "default", "brave", "chrome", "safari", "firefox"
 # Falls back to "default" if no browser detected
-BROWSER_APP = os.getenv(
-    "ZGET_BROWSER_APP", PERSISTENT_CONFIG.get("browser_app", _detected_browser or "default")
-)
+_LAZY_SETTINGS: dict[str, tuple[str, str, Callable[[], str | None]]] = {
+    "DEFAULT_COOKIE_BROWSER": ("ZGET_COOKIE_BROWSER", "cookie_browser", _detected_browser),
+    "BROWSER_APP": ("ZGET_BROWSER_APP", "browser_app", lambda: _detected_browser() or "default"),
+}
+
+
+def _lazy_setting(name: str) -> str | None:
+    """Module-global value of a lazy setting, resolving and caching it on first use."""
+    namespace = globals()
+    if name not in namespace:
+        namespace[name] = _env_or_config(*_LAZY_SETTINGS[name])
+    return namespace[name]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy_setting(name)
+
 
 # Browser profile directory name (for Brave/Chrome)
 # Use None for default profile, or specify like "Profile 1", "Profile 4", etc.
@@ -274,19 +329,38 @@ PLATFORM_DISPLAY = {
 }
 
 
+# Every platform domain -> its platform, for suffix lookups on the URL's host
+_HOST_TO_PLATFORM = {
+    domain: plat for plat, domains in PLATFORM_PATTERNS.items() for domain in domains
+}
+
+
+def _url_host(url: str) -> str:
+    """Lowercased host of a URL; scheme-less input like "youtu.be/abc" is accepted."""
+    try:
+        parts = urlsplit(url)
+        if not parts.netloc:
+            parts = urlsplit("//" + url)
+        return parts.hostname or ""
+    except ValueError:  # e.g. an unbalanced IPv6 bracket
+        return ""
+
+
+# Sized for scripted use: list-channel / batch callers classify thousands of URLs
+@lru_cache(maxsize=4096)
 def detect_platform(url: str) -> str:
-    """Detect the platform from a URL."""
-    url_lower = url.lower()
-    for plat, patterns in PLATFORM_PATTERNS.items():
-        for pattern in patterns:
-            # Check for proper domain boundary: pattern must be followed by / or end of domain
-            # This prevents 't.co' from matching in 'combatfootage'
-            idx = url_lower.find(pattern)
-            if idx != -1:
-                end_idx = idx + len(pattern)
-                # Check that pattern is at domain boundary (followed by /, :, or end)
-                if end_idx >= len(url_lower) or url_lower[end_idx] in ("/", ":", "?", "#"):
-                    return plat
+    """Detect the platform from a URL (memoized; handlers re-ask for the same URL).
+
+    Only the host is matched, on a domain boundary: "t.co" does not match
+    "combatfootage", and "x.com" does not match "netflix.com".
+    """
+    host = _url_host(url)
+    # Probe "www.youtube.com", then "youtube.com", ... until one label is left
+    while "." in host:
+        plat = _HOST_TO_PLATFORM.get(host)
+        if plat:
+            return plat
+        host = host.partition(".")[2]
     return "other"
 
 
@@ -311,8 +385,14 @@ def get_video_output_dir(platform: str) -> Path:
         # Organized by platform (default)
         output_dir = base_dir / platform
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    return _created_dir(output_dir)
+
+
+@lru_cache(maxsize=64)
+def _created_dir(path: Path) -> Path:
+    """mkdir -p once per directory per process; download dirs are not removed under us."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def get_filename_template() -> str:
@@ -330,10 +410,22 @@ def get_check_interval(platform: str) -> int:
 
 def get_cookie_browser(platform: str) -> str:
     """Get the browser to use for cookie extraction for a platform."""
-    return PLATFORM_COOKIE_BROWSERS.get(platform, DEFAULT_COOKIE_BROWSER)
+    if platform in PLATFORM_COOKIE_BROWSERS:
+        return PLATFORM_COOKIE_BROWSERS[platform]
+    return _lazy_setting("DEFAULT_COOKIE_BROWSER")
 
 
 def ensure_directories() -> None:
-    """Create all necessary directories if they don't exist."""
-    for directory in [ZGET_HOME, VIDEOS_DIR, THUMBNAILS_DIR, EXPORTS_DIR, LOGS_DIR]:
-        directory.mkdir(parents=True, exist_ok=True)
+    """Create all necessary directories if they don't exist.
+
+    One listing of ZGET_HOME settles the common case where they all do.
+    """
+    try:
+        with os.scandir(ZGET_HOME) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        ZGET_HOME.mkdir(parents=True, exist_ok=True)
+        existing = set()
+    for directory in (VIDEOS_DIR, THUMBNAILS_DIR, EXPORTS_DIR, LOGS_DIR):
+        if directory.name not in existing:
+            directory.mkdir(parents=True, exist_ok=True)
@@ -2,6 +2,20 @@
 Cookie management utilities.
 """
 
+# Browsers yt-dlp can read cookies from
+VALID_BROWSERS = frozenset(
+    {
+        "chrome",
+        "firefox",
+        "safari",
+        "edge",
+        "chromium",
+        "brave",
+        "opera",
+        "vivaldi",
+    }
+)
+
 
 def get_cookies_from_browser(browser: str = "chrome") -> str:
     """
@@ -17,21 +31,11 @@ def get_cookies_from_browser(browser: str = "chrome") -> str:
         This is a convenience function. The actual cookie extraction
         is handled by yt-dlp's --cookies-from-browser option.
     """
-    valid_browsers = {
-        "chrome",
-        "firefox",
-        "safari",
-        "edge",
-        "chromium",
-        "brave",
-        "opera",
-        "vivaldi",
-    }
     browser = browser.lower()
 
-    if browser not in valid_browsers:
+    if browser not in VALID_BROWSERS:
         raise ValueError(
-            f"Unknown browser: {browser}. Valid options: {', '.join(sorted(valid_browsers))}"
+            f"Unknown browser: {browser}. Valid options: {', '.join(sorted(VALID_BROWSERS))}"
         )
 
     return browser
@@ -4,16 +4,33 @@ Core download functionality wrapping yt-dlp.
 Enhanced version with format selection, file hashing, and full metadata extraction.
 """
 
+import copy
 import hashlib
-from collections.abc import Callable
+import os
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
-import yt_dlp
+# yt_dlp is imported inside the functions that run it: it loads hundreds of
+# extractor modules that hashing / date parsing / library callers never need.
+
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None
+    BLAKE3_AVAILABLE = False
 
 from .config import (
     BROWSER_PROFILE,
+    USE_ARIA2C,
     detect_platform,
     get_cookie_browser,
     get_filename_template,
@@ -28,6 +45,110 @@ from .platforms.cspan import (
 )
 from .types import ProgressDict, YtdlpInfo
 
+# Read size for hashing media files (1 MiB: few syscalls, good readahead)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Anti-bot request headers for downloads (copied per call; C-SPAN adds its own)
+BROWSER_HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/130.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml,"
+        "application/xml;q=0.9,"
+        "image/avif,image/webp,*/*;q=0.8"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Best available video+audio, merged to mp4
+# Prefer H.264 (avc1) for broad player compatibility
+# Avoids VP9-in-MP4 issues on some clients
+BEST_MP4_FORMAT = (
+    "bv*[ext=mp4][vcodec^=avc]+ba[ext=m4a]"  # Best: H.264 + AAC
+    "/bv*[ext=mp4]+ba[ext=m4a]"  # Any mp4 video + AAC
+    "/bv*[vcodec^=avc]+ba"  # H.264 + any audio
+    "/bv*+ba"  # Any video + any audio
+    "/b"  # Single best (pre-merged)
+)
+
+# Twitter's progressive HTTP renditions, best first, then any video+audio
+TWITTER_HTTP_FORMAT = "http-10368/http-2176/http-832/http-256/bv*+ba/b"
+
+# Minimum seconds between "downloading" progress callbacks ("finished" always fires)
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+# aria2c flags when USE_ARIA2C: 16 connections / splits of >=1 MiB, no preallocation
+ARIA2C_ARGS = ["-x16", "-s16", "-k1M", "--file-allocation=none", "--console-log-level=warn"]
+
+# extract_info results are reused for this long (seconds). The MCP server is
+# long-lived and agents typically ask for info, then formats, for one URL.
+INFO_CACHE_TTL = 300.0
+INFO_CACHE_SIZE = 64
+
+# (url, cookies_from, cookies_file) -> (monotonic expiry, raw yt-dlp info,
+# (platform, original_url, cspan_meta)). The raw info is kept so download()
+# hands process_ie_result what yt-dlp produced; extract_info sanitizes per call.
+_InfoKey = tuple[str, str | None, str | None]
+_InfoContext = tuple[str, str, dict | None]
+_info_cache: dict[_InfoKey, tuple[float, YtdlpInfo, _InfoContext]] = {}
+# CLI worker threads and MCP tools share the cache
+_info_cache_lock = threading.Lock()
+
+
+def _cookie_opts(platform: str, cookies_from: str | None, cookies_file: str | Path | None) -> dict:
+    """yt-dlp cookie options: explicit browser, else cookies.txt, else the platform default."""
+    if cookies_from:
+        return {"cookiesfrombrowser": (cookies_from,)}
+    if cookies_file:
+        return {"cookiefile": str(cookies_file)}
+    default_browser = get_cookie_browser(platform)
+    if not default_browser:
+        # No browser detected: skip cookies (public content still downloads)
+        return {}
+    if BROWSER_PROFILE:
+        return {"cookiesfrombrowser": (default_browser, BROWSER_PROFILE)}
+    return {"cookiesfrombrowser": (default_browser,)}
+
+
+def _extraction_opts(
+    platform: str,
+    cookies_from: str | None,
+    cookies_file: str | Path | None,
+    cspan_meta: dict | None,
+    *,
+    quiet: bool,
+) -> dict:
+    """
+    yt-dlp options that decide what an extraction returns.
+
+    Shared by extract_info and _download_one so a cached extraction carries
+    the same format URLs a download's own extraction would.
+    """
+    http_headers = dict(BROWSER_HTTP_HEADERS)
+    if cspan_meta:
+        # HLS fragments 403 without C-SPAN Referer/Origin
+        http_headers.update(cspan_http_headers())
+    return {
+        "quiet": quiet,
+        "no_warnings": quiet,
+        # IMPORTANT: Only download single video, not entire playlist
+        "noplaylist": True,
+        # Enable EJS challenge solver for YouTube's n parameter
+        "remote_components": ["ejs:github"],
+        # Anti-Bot Headers (Bypass 403 specific blocks)
+        "http_headers": http_headers,
+        # Cookie authentication (only if a browser is configured/detected)
+        **_cookie_opts(platform, cookies_from, cookies_file),
+    }
+
+
+@lru_cache(maxsize=1)
+def _aria2c_available() -> bool:
+    return shutil.which("aria2c") is not None
+
 
 def _safe_filename_part(value: str) -> str:
     return "".join(ch if (ch.isalnum() or ch in " -_.") else "_" for ch in value).strip()[:100]
@@ -74,25 +195,14 @@ def _download_one(
     title: str | None = None,
     source_url: str | None = None,
     channel: str | None = None,
+    info_dict: YtdlpInfo | None = None,
+    keep_formats: bool = False,
 ) -> YtdlpInfo:
-    """Download a single URL (already C-SPAN-resolved if applicable)."""
-    http_headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/130.0.0.0 Safari/537.36"
-        ),
-        "Accept": (
-            "text/html,application/xhtml+xml,"
-            "application/xml;q=0.9,"
-            "image/avif,image/webp,*/*;q=0.8"
-        ),
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    if cspan_meta:
-        # HLS fragments 403 without C-SPAN Referer/Origin
-        http_headers.update(cspan_http_headers())
+    """Download a single URL (already C-SPAN-resolved if applicable).
 
+    With ``info_dict`` (an earlier extraction of ``url``), yt-dlp downloads
+    from it instead of extracting the page again.
+    """
     outtmpl = str(output_dir / get_filename_template())
     if cspan_meta:
         outtmpl = _cspan_outtmpl(output_dir, cspan_meta)
@@ -103,22 +213,21 @@ def _download_one(
             channel=channel or publisher_from_url(source_url or original_url or url),
         )
 
-    opts = {
-        "outtmpl": outtmpl,
-        "quiet": quiet,
-        "no_warnings": quiet,
-        "retries": 3,
-        "fragment_retries": 3,
-        "concurrent_fragment_downloads": 8,
-        "restrictfilenames": False,  # Allow unicode in filenames
-        "windowsfilenames": True,  # But sanitize for safety
-        # IMPORTANT: Only download single video, not entire playlist
-        "noplaylist": True,
-        # Enable EJS challenge solver for YouTube's n parameter
-        "remote_components": ["ejs:github"],
-        # Anti-Bot Headers (Bypass 403 specific blocks)
-        "http_headers": http_headers,
-    }
+    opts = _extraction_opts(platform, cookies_from, cookies_file, cspan_meta, quiet=quiet)
+    opts.update(
+        {
+            "outtmpl": outtmpl,
+            "retries": 3,
+            "fragment_retries": 3,
+            "concurrent_fragment_downloads": 8,
+            "restrictfilenames": False,  # Allow unicode in filenames
+            "windowsfilenames": True,  # But sanitize for safety
+        }
+    )
+
+    if USE_ARIA2C and _aria2c_available():
+        opts["external_downloader"] = {"http": "aria2c"}
+        opts["external_downloader_args"] = {"aria2c": ARIA2C_ARGS}
 
     # Format selection
     if format_id:
@@ -143,19 +252,10 @@ def _download_one(
         if platform == "twitter":
             # Twitter: prefer HTTP formats over HLS to avoid token expiration issues
             # HLS tokens expire during download causing failures at 20-30%
-            opts["format"] = "http-10368/http-2176/http-832/http-256/bv*+ba/b"
+            opts["format"] = TWITTER_HTTP_FORMAT
             opts["merge_output_format"] = "mp4"
         else:
-            # Best available video+audio, merged to mp4
-            # Prefer H.264 (avc1) for broad player compatibility
-            # Avoids VP9-in-MP4 issues on some clients
-            opts["format"] = (
-                "bv*[ext=mp4][vcodec^=avc]+ba[ext=m4a]"  # Best: H.264 + AAC
-                "/bv*[ext=mp4]+ba[ext=m4a]"  # Any mp4 video + AAC
-                "/bv*[vcodec^=avc]+ba"  # H.264 + any audio
-                "/bv*+ba"  # Any video + any audio
-                "/b"  # Single best (pre-merged)
-            )
+            opts["format"] = BEST_MP4_FORMAT
             opts["merge_output_format"] = "mp4"
     else:
         # Constrain to max height, still prioritizing compatible codecs
@@ -168,43 +268,40 @@ def _download_one(
         )
         opts["merge_output_format"] = "mp4"
 
-    # Cookie authentication (only if a browser is configured/detected)
-    if cookies_from:
-        opts["cookiesfrombrowser"] = (cookies_from,)
-    elif cookies_file:
-        opts["cookiefile"] = str(cookies_file)
-    else:
-        # Use platform-specific default browser for cookies (if available)
-        default_browser = get_cookie_browser(platform)
-        if default_browser:
-            if BROWSER_PROFILE:
-                opts["cookiesfrombrowser"] = (default_browser, BROWSER_PROFILE)
-            else:
-                opts["cookiesfrombrowser"] = (default_browser,)
-        # If no browser detected, skip cookies entirely (downloads still work for public content)
-
     # Progress callback
     downloaded_filepath = None
 
     if progress_callback:
+        last_emit = 0.0
 
         def progress_hook(d):
-            nonlocal downloaded_filepath
-            if d["status"] == "finished":
+            nonlocal downloaded_filepath, last_emit
+            status = d["status"]
+            if status == "finished":
                 downloaded_filepath = d.get("filename")
-            if d["status"] in ("downloading", "finished"):
-                progress_callback(
-                    {
-                        "status": d["status"],
-                        "filename": d.get("filename"),
-                        "downloaded_bytes": d.get("downloaded_bytes", 0),
-                        "total_bytes": d.get("total_bytes") or d.get("total_bytes_estimate", 0),
-                        "speed": d.get("speed", 0),
-                        "eta": d.get("eta", 0),
-                        "fragment_index": d.get("fragment_index"),
-                        "fragment_count": d.get("fragment_count"),
-                    }
-                )
+            elif status == "downloading":
+                # yt-dlp fires a hook per network chunk / fragment; coalesce to
+                # PROGRESS_UPDATE_INTERVAL, but never drop the completing update
+                now = time.monotonic()
+                if now - last_emit < PROGRESS_UPDATE_INTERVAL:
+                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                    if not total or d.get("downloaded_bytes", 0) < total:
+                        return
+                last_emit = now
+            else:
+                return
+            progress_callback(
+                {
+                    "status": status,
+                    "filename": d.get("filename"),
+                    "downloaded_bytes": d.get("downloaded_bytes", 0),
+                    "total_bytes": d.get("total_bytes") or d.get("total_bytes_estimate", 0),
+                    "speed": d.get("speed", 0),
+                    "eta": d.get("eta", 0),
+                    "fragment_index": d.get("fragment_index"),
+                    "fragment_count": d.get("fragment_count"),
+                }
+            )
 
         opts["progress_hooks"] = [progress_hook]
     else:
@@ -217,8 +314,13 @@ def _download_one(
         opts["progress_hooks"] = [progress_hook]
 
     # Download (url may be a resolved m3u8 for C-SPAN UVP pages)
+    import yt_dlp
+
     with yt_dlp.YoutubeDL(opts) as ydl:
-        info = ydl.extract_info(url, download=True)
+        if info_dict is not None:
+            info = ydl.process_ie_result(copy.deepcopy(info_dict), download=True)
+        else:
+            info = ydl.extract_info(url, download=True)
         info = merge_cspan_meta(info, cspan_meta)
 
         # Get the final filename
@@ -242,6 +344,8 @@ def _download_one(
                     downloaded_filepath = str(merged_path)
 
     # Sanitize metadata for database (remove non-JSON-serializable objects)
+    if not keep_formats:
+        info = _drop_bulky_info(info)
     info = _sanitize_info(info)
     info = merge_cspan_meta(info, cspan_meta)
 
@@ -313,6 +417,8 @@ def download(
     title: str | None = None,
     source_url: str | None = None,
     channel: str | None = None,
+    info_dict: YtdlpInfo | None = None,
+    keep_formats: bool = False,
 ) -> YtdlpInfo:
     """
     Download video/audio from URL.
@@ -331,6 +437,12 @@ def download(
         title: Source title, when the capture cannot report one (raw asset URLs)
         source_url: Citable page the media belongs to, when ``url`` is an asset
         channel: Publisher, when the capture reports no uploader
+        info_dict: Result of an earlier extract_info(url) to download from,
+            skipping a second page extraction. With ``format_id`` and no
+            ``info_dict``, a cached extract_info result is used if fresh.
+        keep_formats: Keep the full ``formats`` table, captions, heatmap and
+            per-fragment URLs in the result (dropped by default: they are
+            most of the info dict and describe files that weren't downloaded)
 
     Returns:
         dict with full yt-dlp info_dict including downloaded file info.
@@ -365,14 +477,18 @@ def download(
         output_dir = get_video_output_dir(platform)
     else:
         output_dir = Path(output_dir)
-
-    output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
     cspan_jobs: list[tuple[str, dict]] = []
     if is_cspan_hls_url(url):
         cspan_jobs = prepare_cspan_downloads(url, cookies_from_browser=cookies_from)
 
     if not cspan_jobs:
+        if info_dict is None and format_id:
+            hit = _cached_info(_info_key(url, cookies_from, cookies_file))
+            info_dict = hit[0] if hit is not None else None
+        if info_dict is not None and "formats" not in info_dict:
+            info_dict = None  # playlists etc. need yt-dlp's own extraction
         return _download_one(
             url,
             platform=platform,
@@ -390,6 +506,8 @@ def download(
             title=title,
             source_url=source_url,
             channel=channel,
+            info_dict=info_dict,
+            keep_formats=keep_formats,
         )
 
     results: list[YtdlpInfo] = []
@@ -412,6 +530,7 @@ def download(
                 title=title,
                 source_url=source_url,
                 channel=channel,
+                keep_formats=keep_formats,
             )
         )
 
@@ -426,6 +545,8 @@ def extract_info(
     url: str,
     cookies_from: str | None = None,
     cookies_file: str | Path | None = None,
+    *,
+    cache: bool = False,
 ) -> YtdlpInfo:
     """
     Extract video metadata without downloading.
@@ -434,10 +555,18 @@ def extract_info(
         url: Video URL
         cookies_from: Browser to extract cookies from
         cookies_file: Path to cookies.txt file
+        cache: Reuse a result for the same URL and cookies from the last
+            INFO_CACHE_TTL seconds instead of re-extracting. Off by default:
+            a reused result can be that old, so view counts, live status
+            and signed format URLs may be stale
 
     Returns:
-        dict with full yt-dlp info_dict
+        dict with full yt-dlp info_dict, sanitized fresh on every call
     """
+    key = _info_key(url, cookies_from, cookies_file)
+    if cache and (cached := _cached_info(key)) is not None:
+        return _present_info(*cached)
+
     platform = detect_platform(url)
     original_url = url
     cspan_meta = None
@@ -458,31 +587,27 @@ def extract_info(
                     for _, m in jobs
                 ]
 
-    opts: dict = {
-        "quiet": True,
-        "no_warnings": True,
-    }
-    if cspan_meta:
-        opts["http_headers"] = cspan_http_headers()
+    opts = _extraction_opts(platform, cookies_from, cookies_file, cspan_meta, quiet=True)
 
-    if cookies_from:
-        opts["cookiesfrombrowser"] = (cookies_from,)
-    elif cookies_file:
-        opts["cookiefile"] = str(cookies_file)
-    else:
-        default_browser = get_cookie_browser(platform)
-        if default_browser:
-            if BROWSER_PROFILE:
-                opts["cookiesfrombrowser"] = (default_browser, BROWSER_PROFILE)
-            else:
-                opts["cookiesfrombrowser"] = (default_browser,)
-        # If no browser detected, skip cookies entirely
+    import yt_dlp
 
     with yt_dlp.YoutubeDL(opts) as ydl:
-        info = ydl.extract_info(url, download=False)
+        raw = ydl.extract_info(url, download=False)
 
-    # Sanitize metadata
-    info = _sanitize_info(info)
+    context = (platform, original_url, cspan_meta)
+    with _info_cache_lock:
+        _info_cache.pop(key, None)
+        if len(_info_cache) >= INFO_CACHE_SIZE:
+            del _info_cache[next(iter(_info_cache))]  # oldest entry
+        _info_cache[key] = (time.monotonic() + INFO_CACHE_TTL, raw, context)
+    return _present_info(raw, *context)
+
+
+def _present_info(
+    raw: YtdlpInfo, platform: str, original_url: str, cspan_meta: dict | None
+) -> YtdlpInfo:
+    """extract_info's result for a raw yt-dlp info dict: sanitized, with zget's keys."""
+    info = _sanitize_info(raw)
     info = merge_cspan_meta(info, cspan_meta)
     info["_zget_platform"] = platform
     if cspan_meta:
@@ -498,6 +623,28 @@ def extract_info(
     return info
 
 
+def _info_key(url: str, cookies_from: str | None, cookies_file: str | Path | None) -> _InfoKey:
+    return (url, cookies_from, str(cookies_file) if cookies_file else None)
+
+
+def _cached_info(key: _InfoKey) -> tuple[YtdlpInfo, str, str, dict | None] | None:
+    """The cached raw info and its context for key, unless it has expired."""
+    with _info_cache_lock:
+        hit = _info_cache.get(key)
+    if hit is None or hit[0] <= time.monotonic():
+        return None
+    return (hit[1], *hit[2])
+
+
+# yt-dlp's "no such stream" codec values
+_NO_CODEC = frozenset({"none", None})
+
+
+def _format_quality(f: dict) -> tuple[float, float]:
+    """Sort key for list_formats rows: height, then total bitrate."""
+    return (f["height"] or 0, f["tbr"] or 0)
+
+
 def list_formats(
     url: str,
     cookies_from: str | None = None,
@@ -516,35 +663,38 @@ def list_formats(
     Returns:
         List of format dicts with id, extension, resolution, codec info
     """
-    info = extract_info(url, cookies_from, cookies_file)
+    # cached so a download(format_id=...) that follows reuses this extraction
+    info = extract_info(url, cookies_from, cookies_file, cache=True)
 
     formats = []
     for f in info.get("formats", []):
-        # Skip formats without video or audio
-        vcodec = f.get("vcodec", "none")
-        acodec = f.get("acodec", "none")
-
-        format_dict = {
-            "format_id": f.get("format_id"),
-            "ext": f.get("ext"),
-            "resolution": f.get("resolution") or _build_resolution(f),
-            "width": f.get("width"),
-            "height": f.get("height"),
-            "fps": f.get("fps"),
-            "vcodec": vcodec if vcodec != "none" else None,
-            "acodec": acodec if acodec != "none" else None,
-            "filesize": f.get("filesize") or f.get("filesize_approx"),
-            "tbr": f.get("tbr"),  # Total bitrate
-            "vbr": f.get("vbr"),  # Video bitrate
-            "abr": f.get("abr"),  # Audio bitrate
-            "format_note": f.get("format_note"),
-            "has_video": vcodec not in ("none", None),
-            "has_audio": acodec not in ("none", None),
-        }
-        formats.append(format_dict)
+        get = f.get
+        vcodec = get("vcodec", "none")
+        acodec = get("acodec", "none")
+        has_video = vcodec not in _NO_CODEC
+        has_audio = acodec not in _NO_CODEC
+        formats.append(
+            {
+                "format_id": get("format_id"),
+                "ext": get("ext"),
+                "resolution": get("resolution") or _build_resolution(f),
+                "width": get("width"),
+                "height": get("height"),
+                "fps": get("fps"),
+                "vcodec": vcodec if has_video else None,
+                "acodec": acodec if has_audio else None,
+                "filesize": get("filesize") or get("filesize_approx"),
+                "tbr": get("tbr"),  # Total bitrate
+                "vbr": get("vbr"),  # Video bitrate
+                "abr": get("abr"),  # Audio bitrate
+                "format_note": get("format_note"),
+                "has_video": has_video,
+                "has_audio": has_audio,
+            }
+        )
 
     # Sort by quality (height, then bitrate)
-    formats.sort(key=lambda x: (x.get("height") or 0, x.get("tbr") or 0), reverse=True)
+    formats.sort(key=_format_quality, reverse=True)
 
     return formats
 
@@ -558,7 +708,7 @@ def _build_resolution(f: YtdlpInfo) -> str:
     elif height:
         return f"{height}p"
     else:
-        return "audio only" if f.get("acodec") not in ("none", None) else "unknown"
+        return "audio only" if f.get("acodec") not in _NO_CODEC else "unknown"
 
 
 def compute_file_hash(file_path: Path | str, algorithm: str = "sha256") -> str:
@@ -567,28 +717,71 @@ def compute_file_hash(file_path: Path | str, algorithm: str = "sha256") -> str:
 
     Args:
         file_path: Path to the file
-        algorithm: Hash algorithm ("sha256", "md5", etc.)
+        algorithm: Hash algorithm ("sha256", "md5", etc.). "blake3" (multi-threaded,
+            much faster on large files) needs the blake3 package (zget[fast]).
 
     Returns:
         Hex digest of the hash
     """
-    file_path = Path(file_path)
-
-    if algorithm == "sha256":
-        hasher = hashlib.sha256()
-    elif algorithm == "md5":
-        hasher = hashlib.md5()
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 hashing requires the blake3 package (pip install zget[fast])")
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
     else:
-        hasher = hashlib.new(algorithm)
+        hasher = None
 
-    # Read in chunks to handle large files efficiently
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+    # Unbuffered: reads land straight in the hasher's buffer, not a BufferedReader's
+    with open(file_path, "rb", buffering=0) as f:
+        _advise_sequential(f.fileno())
+
+        # Python 3.11+: hashlib reads straight into its own buffer with the GIL released
+        if hasher is None and hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+        # 3.10 and blake3: same shape by hand - one reused buffer, no per-chunk bytes objects
+        if hasher is None:
+            hasher = hashlib.new(algorithm)
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            hasher.update(view[:n])
 
     return hasher.hexdigest()
 
 
+def compute_file_hashes(
+    paths: Iterable[Path | str], algorithm: str = "sha256", max_workers: int | None = None
+) -> dict[Path | str, str]:
+    """
+    Hash many files concurrently (hashlib releases the GIL while hashing).
+
+    Args:
+        paths: Files to hash
+        algorithm: As for compute_file_hash
+        max_workers: Thread count (default: CPU count, at most 8 - disks saturate first)
+
+    Returns:
+        {path: hex digest}, keyed by the paths as given. The first unreadable
+        file's OSError is raised.
+    """
+    paths = list(paths)
+    workers = max_workers or min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = pool.map(lambda p: compute_file_hash(p, algorithm), paths)
+        return dict(zip(paths, digests))
+
+
+def _advise_sequential(fd: int) -> None:
+    """Ask the kernel for aggressive readahead so disk reads overlap hashing."""
+    if not hasattr(os, "posix_fadvise"):
+        return  # macOS / Windows: no fadvise, default readahead applies
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1024)
 def parse_upload_date(date_str: str | None) -> datetime | None:
     """
     Parse yt-dlp upload_date format (YYYYMMDD) to datetime.
@@ -603,6 +796,9 @@ def parse_upload_date(date_str: str | None) -> datetime | None:
         return None
 
     try:
+        # Canonical YYYYMMDD: slice instead of strptime (no format/locale parsing)
+        if len(date_str) == 8 and date_str.isdigit():
+            return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
         return datetime.strptime(date_str, "%Y%m%d")
     except ValueError:
         return None
@@ -649,6 +845,8 @@ def get_recent_videos_from_channel(
     elif cookies_file:
         opts["cookiefile"] = str(cookies_file)
 
+    import yt_dlp
+
     with yt_dlp.YoutubeDL(opts) as ydl:
         info = ydl.extract_info(channel_url, download=False)
 
@@ -662,16 +860,16 @@ def get_recent_videos_from_channel(
 
     since_dt = _parse_bound_date(since)
     until_dt = _parse_bound_date(until)
+    since_day = since_dt.date() if since_dt else None
+    until_day = until_dt.date() if until_dt else None
     platform = detect_platform(channel_url)
     channel_uploader = info.get("uploader") or info.get("channel") or info.get("title")
 
     videos: list[YtdlpInfo] = []
-    for entry in entries:
-        if entry is None:
-            continue
-
-        upload_date = entry.get("upload_date")
-        timestamp = entry.get("timestamp") or entry.get("release_timestamp")
+    for entry in filter(None, entries):
+        get = entry.get
+        upload_date = get("upload_date")
+        timestamp = get("timestamp") or get("release_timestamp")
         entry_dt = parse_upload_date(upload_date) if upload_date else None
         if entry_dt is None and timestamp is not None:
             try:
@@ -682,13 +880,13 @@ def get_recent_videos_from_channel(
 
         # Flat extract sometimes still omits date; keep undated rows (don't drop).
         if entry_dt is not None:
-            if since_dt and entry_dt.date() < since_dt.date():
+            if since_day and entry_dt.date() < since_day:
                 continue
-            if until_dt and entry_dt.date() > until_dt.date():
+            if until_day and entry_dt.date() > until_day:
                 continue
 
-        vid = entry.get("id")
-        url = entry.get("webpage_url") or entry.get("url")
+        vid = get("id")
+        url = get("webpage_url") or get("url")
         if not url and vid:
             url = _guess_watch_url(platform, vid, entry)
 
@@ -702,16 +900,16 @@ def get_recent_videos_from_channel(
         videos.append(
             {
                 "id": vid,
-                "title": entry.get("title"),
+                "title": get("title"),
                 "url": url,
-                "uploader": entry.get("uploader") or entry.get("channel") or channel_uploader,
+                "uploader": get("uploader") or get("channel") or channel_uploader,
                 "upload_date": upload_date,
                 "timestamp": timestamp,
-                "duration": entry.get("duration"),
-                "view_count": entry.get("view_count"),
-                "description": entry.get("description"),
-                "live_status": entry.get("live_status"),
-                "was_live": entry.get("was_live"),
+                "duration": get("duration"),
+                "view_count": get("view_count"),
+                "description": get("description"),
+                "live_status": get("live_status"),
+                "was_live": get("was_live"),
                 "_zget_platform": platform,
             }
         )
@@ -740,31 +938,93 @@ def _guess_watch_url(platform: str, video_id: str, entry: dict) -> str | None:
     return entry.get("original_url") or entry.get("webpage_url")
 
 
+# Post-download info keys describing what was *not* downloaded (often most of the dict)
+_BULKY_INFO_KEYS = frozenset({"formats", "automatic_captions", "heatmap"})
+
+
+def _drop_bulky_info(info: YtdlpInfo) -> YtdlpInfo:
+    """Copy of info without _BULKY_INFO_KEYS or the chosen formats' fragment lists."""
+    info = {k: v for k, v in info.items() if k not in _BULKY_INFO_KEYS}
+    for key in ("requested_formats", "requested_downloads"):
+        chosen = info.get(key)
+        if isinstance(chosen, list):
+            info[key] = [
+                {k: v for k, v in f.items() if k != "fragments"} if isinstance(f, dict) else f
+                for f in chosen
+            ]
+    return info
+
+
+# Leaf types _sanitize_info passes through untouched (checked with type(), not isinstance)
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+# Private ("_"-prefixed) keys that survive sanitizing
+_KEPT_PRIVATE_KEYS = frozenset(
+    {
+        "_zget_filepath",
+        "_zget_platform",
+        "_zget_downloaded_at",
+        "_zget_cspan_program",
+        "_zget_cspan_m3u8",
+    }
+)
+
+
+# Top-level info keys too large or too yt-dlp-internal to keep in raw_metadata
+_STORAGE_EXCLUDED_KEYS = frozenset(
+    {
+        "formats",  # Large list of all formats
+        "thumbnails",  # Large list of all thumbnails
+        "subtitles",  # Can be very large
+        "automatic_captions",  # Can be very large
+        "requested_downloads",  # Internal yt-dlp data
+        "requested_formats",  # Internal yt-dlp data
+        "http_headers",  # Internal
+    }
+)
+
+
+def storage_metadata(info: YtdlpInfo) -> YtdlpInfo:
+    """
+    The part of a download()/extract_info() result worth storing as raw_metadata.
+
+    Drops the bulky format/caption/thumbnail tables and private keys other
+    than zget's own. Values are not re-checked: both functions already
+    return JSON-safe dicts.
+    """
+    return {
+        key: value
+        for key, value in info.items()
+        if key not in _STORAGE_EXCLUDED_KEYS
+        and (not key.startswith("_") or key.startswith("_zget"))
+    }
+
+
 def _sanitize_info(info: YtdlpInfo) -> YtdlpInfo:
     """
     Recursively sanitize yt-dlp info_dict for JSON serialization.
 
     Removes non-serializable objects like post-processors or logger objects.
+    Scalar leaves (the bulk of a formats table) are copied inline rather than
+    through a recursive call.
     """
-    serializable_types = (str, int, float, bool, type(None))
-
-    if isinstance(info, dict):
+    kind = type(info)
+    if kind is dict:
         return {
-            str(k): _sanitize_info(v)
+            key: v if type(v) in _JSON_SCALARS else _sanitize_info(v)
             for k, v in info.items()
-            if not str(k).startswith("_")
-            or k
-            in (
-                "_zget_filepath",
-                "_zget_platform",
-                "_zget_downloaded_at",
-                "_zget_cspan_program",
-                "_zget_cspan_m3u8",
-            )
+            if not (key := k if type(k) is str else str(k)).startswith("_")
+            or key in _KEPT_PRIVATE_KEYS
         }
+    elif kind is list:
+        return [i if type(i) in _JSON_SCALARS else _sanitize_info(i) for i in info]
+    elif kind in _JSON_SCALARS:
+        return info
+    elif isinstance(info, dict):
+        return _sanitize_info(dict(info))
     elif isinstance(info, list):
-        return [_sanitize_info(i) for i in info]
-    elif isinstance(info, serializable_types):
+        return _sanitize_info(list(info))
+    elif isinstance(info, (str, int, float)):
         return info
     else:
         # Convert everything else to string representation
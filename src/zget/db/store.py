@@ -4,20 +4,49 @@ zget database store.
 SQLite operations with FTS5 full-text search.
 """
 
-import json
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from .. import _json
 from .models import DownloadTask, Video, WatchedAccount
 
 # ============================================================================
 # SCHEMA
 # ============================================================================
 
-SCHEMA_VERSION = 1
+# 2: platform_stats summary table and triggers, *_downloaded composite indexes
+SCHEMA_VERSION = 2
+
+# Per-connection tuning (negative cache_size is KiB, not pages)
+CACHE_SIZE_KIB = -65536
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# Applied once when a connection is opened; synchronous=NORMAL is durable
+# enough under WAL, and FTS/ORDER BY scratch tables stay off disk
+CONNECTION_PRAGMAS = f"""
+PRAGMA foreign_keys = ON;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = {CACHE_SIZE_KIB};
+PRAGMA mmap_size = {MMAP_SIZE_BYTES};
+"""
+
+# Without WAL (the file's volume refused it) NORMAL can lose the last commit
+ROLLBACK_JOURNAL_PRAGMAS = "PRAGMA synchronous = FULL;"
+
+# Rows pulled per cursor round-trip when streaming results
+SEARCH_FETCH_SIZE = 64
+SCAN_FETCH_SIZE = 256
+
+# IDs per IN (...) query in get_videos_by_ids; well under SQLite's variable limit
+ID_BATCH_SIZE = 500
+
+# Bound once: the row converters parse up to two timestamps per row
+_fromisoformat = datetime.fromisoformat
 
 SCHEMA = """
 -- Schema version tracking
@@ -109,6 +138,44 @@ CREATE TRIGGER IF NOT EXISTS videos_au AFTER UPDATE ON videos BEGIN
     VALUES (new.id, new.title, new.description, new.uploader, new.tags, new.notes);
 END;
 
+-- Per-platform counts and sizes for stats, kept current by triggers so
+-- get_stats() reads a handful of rows instead of scanning videos
+CREATE TABLE IF NOT EXISTS platform_stats (
+    platform TEXT PRIMARY KEY,
+    videos INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS videos_stats_ai AFTER INSERT ON videos BEGIN
+    INSERT INTO platform_stats(platform, videos, size_bytes)
+    VALUES (new.platform, 1, COALESCE(new.file_size_bytes, 0))
+    ON CONFLICT(platform) DO UPDATE SET
+        videos = videos + 1,
+        size_bytes = size_bytes + excluded.size_bytes;
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_stats_ad AFTER DELETE ON videos BEGIN
+    UPDATE platform_stats SET
+        videos = videos - 1,
+        size_bytes = size_bytes - COALESCE(old.file_size_bytes, 0)
+    WHERE platform = old.platform;
+    DELETE FROM platform_stats WHERE platform = old.platform AND videos <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS videos_stats_au
+AFTER UPDATE OF platform, file_size_bytes ON videos BEGIN
+    UPDATE platform_stats SET
+        videos = videos - 1,
+        size_bytes = size_bytes - COALESCE(old.file_size_bytes, 0)
+    WHERE platform = old.platform;
+    INSERT INTO platform_stats(platform, videos, size_bytes)
+    VALUES (new.platform, 1, COALESCE(new.file_size_bytes, 0))
+    ON CONFLICT(platform) DO UPDATE SET
+        videos = videos + 1,
+        size_bytes = size_bytes + excluded.size_bytes;
+    DELETE FROM platform_stats WHERE platform = old.platform AND videos <= 0;
+END;
+
 -- ============================================================================
 -- WATCHED ACCOUNTS TABLE
 -- ============================================================================
@@ -204,11 +271,19 @@ CREATE TABLE IF NOT EXISTS download_queue (
 -- INDEXES
 -- ============================================================================
 
-CREATE INDEX IF NOT EXISTS idx_videos_platform ON videos(platform);
-CREATE INDEX IF NOT EXISTS idx_videos_uploader ON videos(uploader);
+-- Filtered listings are "WHERE x = ? ORDER BY downloaded_at DESC LIMIT ?":
+-- a (x, downloaded_at) index answers them without a sort step. The uploader
+-- OR uploader_id lookup still sorts, but only the rows the two indexes find.
+CREATE INDEX IF NOT EXISTS idx_videos_platform_downloaded
+    ON videos(platform, downloaded_at DESC);
+CREATE INDEX IF NOT EXISTS idx_videos_uploader_downloaded
+    ON videos(uploader, downloaded_at DESC);
+CREATE INDEX IF NOT EXISTS idx_videos_uploader_id_downloaded
+    ON videos(uploader_id, downloaded_at DESC);
+CREATE INDEX IF NOT EXISTS idx_videos_collection_downloaded
+    ON videos(collection, downloaded_at DESC);
 CREATE INDEX IF NOT EXISTS idx_videos_downloaded ON videos(downloaded_at);
 CREATE INDEX IF NOT EXISTS idx_videos_hash ON videos(file_hash_sha256);
-CREATE INDEX IF NOT EXISTS idx_videos_collection ON videos(collection);
 
 CREATE INDEX IF NOT EXISTS idx_watched_platform ON watched_accounts(platform);
 CREATE INDEX IF NOT EXISTS idx_watched_enabled ON watched_accounts(enabled);
@@ -218,6 +293,75 @@ CREATE INDEX IF NOT EXISTS idx_queue_created ON download_queue(created_at);
 """
 
 
+# Column order _row_to_video unpacks; every Video query selects these, in
+# this order, so rows can be read positionally instead of by name
+VIDEO_COLUMNS = (
+    "id",
+    "url",
+    "platform",
+    "video_id",
+    "title",
+    "description",
+    "uploader",
+    "uploader_id",
+    "upload_date",
+    "duration_seconds",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "resolution",
+    "fps",
+    "codec",
+    "file_size_bytes",
+    "file_hash_sha256",
+    "local_path",
+    "thumbnail_path",
+    "downloaded_at",
+    "tags",
+    "rating",
+    "notes",
+    "collection",
+    "raw_metadata",
+)
+
+
+def _video_columns(*, raw: bool = True) -> str:
+    """VIDEO_COLUMNS as a select list; raw=False reads NULL for raw_metadata."""
+    return ", ".join(
+        "NULL" if column == "raw_metadata" and not raw else column for column in VIDEO_COLUMNS
+    )
+
+
+VIDEO_SELECT = f"SELECT {_video_columns()} FROM videos"
+# List queries leave the (often large) raw_metadata blob in the table
+VIDEO_LIST_SELECT = f"SELECT {_video_columns(raw=False)} FROM videos"
+
+# Ranked FTS matches as hits(hit_id, score), params (match, limit). Ranking
+# and LIMIT run on the FTS table alone, so only the top rows are joined
+# back to videos; callers re-sort by score after the join.
+_FTS_HITS = """
+WITH hits(hit_id, score) AS (
+    SELECT rowid, rank FROM videos_fts
+    WHERE videos_fts MATCH ?
+    ORDER BY rank
+    LIMIT ?
+)
+"""
+
+
+def _fts_prefix_query(query: str) -> str | None:
+    """
+    The MATCH string for a prefix search on query, or None when it is blank.
+
+    The query is quoted as one FTS5 string, inside which only the double
+    quote is special (doubled); the trailing * makes "departm" match
+    "department".
+    """
+    if not query.strip():
+        return None
+    return '"' + query.replace('"', '""') + '"*'
+
+
 # ============================================================================
 # VIDEO STORE
 # ============================================================================
@@ -230,34 +374,80 @@ class VideoStore:
         """Initialize the store with the given database path."""
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._wal = True
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
         with self._connect() as conn:
+            # WAL is persistent in the file: readers stop blocking the writer.
+            # Volumes without shared memory (network shares, read-only media)
+            # refuse it; the library then stays in its current journal mode.
+            try:
+                mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            except sqlite3.OperationalError:
+                mode = None
+            if mode != "wal":
+                self._wal = False
+                conn.executescript(ROLLBACK_JOURNAL_PRAGMAS)
             conn.executescript(SCHEMA)
-            # Set schema version
-            conn.execute(
-                "INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (SCHEMA_VERSION,)
-            )
+            # Check and upgrade under the write lock, so a CLI and the MCP
+            # server opening the same library don't both seed platform_stats
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0] or 0
+            if version < 2:
+                # Libraries from before platform_stats: rebuild it from videos;
+                # the triggers keep it current from here on
+                conn.execute("DELETE FROM platform_stats")
+                conn.execute(
+                    """
+                    INSERT INTO platform_stats (platform, videos, size_bytes)
+                    SELECT platform, COUNT(*), COALESCE(SUM(file_size_bytes), 0)
+                    FROM videos GROUP BY platform
+                    """
+                )
+            if version < SCHEMA_VERSION:
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
+                    (SCHEMA_VERSION,),
+                )
             # Drop unused legacy tables from earlier experiments (empty shells)
             for legacy in ("video", "downloadqueueitem"):
                 conn.execute(f"DROP TABLE IF EXISTS {legacy}")
+            # Single-column indexes now covered by the *_downloaded composites
+            for legacy in ("idx_videos_platform", "idx_videos_uploader", "idx_videos_collection"):
+                conn.execute(f"DROP INDEX IF EXISTS {legacy}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened and tuned on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(CONNECTION_PRAGMAS)
+            if not self._wal:
+                conn.executescript(ROLLBACK_JOURNAL_PRAGMAS)
+            self._local.conn = conn
+        return conn
 
     @contextmanager
     def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
+        """Context manager for one unit of work; commits on success."""
+        conn = self._connection()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
+
+    def close(self) -> None:
+        """Close this thread's connection (reopened on next use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
 
     def get_metadata(self, key: str, default: str | None = None) -> str | None:
         """Get a metadata value by key."""
@@ -310,31 +500,51 @@ class VideoStore:
                     video.local_path,
                     video.thumbnail_path,
                     video.downloaded_at.isoformat() if video.downloaded_at else None,
-                    json.dumps(video.tags),
+                    _json.dumps(video.tags),
                     video.rating,
                     video.notes,
                     video.collection,
-                    json.dumps(video.raw_metadata) if video.raw_metadata else None,
+                    _json.dumps(video.raw_metadata) if video.raw_metadata else None,
                 ),
             )
             return cursor.lastrowid  # type: ignore
 
-    def get_video(self, video_id: int) -> Video | None:
-        """Get a video by its database ID."""
+    def get_video(self, video_id: int, *, raw: bool = True) -> Video | None:
+        """Get a video by its database ID (raw=False skips raw_metadata)."""
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
         with self._connect() as conn:
-            row = conn.execute("SELECT * FROM videos WHERE id = ?", (video_id,)).fetchone()
+            row = conn.execute(f"{select} WHERE id = ?", (video_id,)).fetchone()
             return self._row_to_video(row) if row else None
 
-    def get_video_by_url(self, url: str) -> Video | None:
-        """Get a video by its URL."""
+    def get_videos_by_ids(self, video_ids: Iterable[int], *, raw: bool = True) -> dict[int, Video]:
+        """
+        Get many videos by database ID with one query per ID_BATCH_SIZE IDs.
+
+        Returns {id: video} for the IDs that exist; unknown IDs are left out.
+        """
+        ids = list(dict.fromkeys(video_ids))
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
+        found: dict[int, Video] = {}
         with self._connect() as conn:
-            row = conn.execute("SELECT * FROM videos WHERE url = ?", (url,)).fetchone()
+            for start in range(0, len(ids), ID_BATCH_SIZE):
+                batch = ids[start : start + ID_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                for row in conn.execute(f"{select} WHERE id IN ({placeholders})", batch):
+                    video = self._row_to_video(row)
+                    found[video.id] = video
+        return found
+
+    def get_video_by_url(self, url: str, *, raw: bool = True) -> Video | None:
+        """Get a video by its URL (raw=False skips raw_metadata)."""
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
+        with self._connect() as conn:
+            row = conn.execute(f"{select} WHERE url = ?", (url,)).fetchone()
             return self._row_to_video(row) if row else None
 
     def get_video_by_video_id(self, video_id: str) -> Video | None:
         """Get a video by its platform-specific video ID."""
         with self._connect() as conn:
-            row = conn.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+            row = conn.execute(f"{VIDEO_SELECT} WHERE video_id = ?", (video_id,)).fetchone()
             return self._row_to_video(row) if row else None
 
     def get_uploaders(self) -> list[dict]:
@@ -364,83 +574,126 @@ class VideoStore:
             ).fetchone()
             return row is not None
 
-    def search(self, query: str, limit: int = 50) -> list[Video]:
+    def search(self, query: str, limit: int = 50, *, raw: bool = False) -> list[Video]:
         """
         Full-text search across title, description, uploader, tags, notes.
 
         Returns videos sorted by relevance. Supports prefix matching.
+        raw_metadata is only loaded when raw=True.
         """
+        fts_query = _fts_prefix_query(query)
+        if fts_query is None:
+            return []
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
         with self._connect() as conn:
-            # Escape special FTS5 characters and add prefix matching
-            safe_query = query.replace('"', '""')
-            # Add * for prefix matching (so "departm" matches "department")
-            fts_query = f'"{safe_query}"*'
-            rows = conn.execute(
-                """
-                SELECT v.* FROM videos v
-                JOIN videos_fts fts ON v.id = fts.rowid
-                WHERE videos_fts MATCH ?
-                ORDER BY rank
-                LIMIT ?
+            cursor = conn.execute(
+                f"""
+                {_FTS_HITS}
+                {select}
+                JOIN hits ON id = hit_id
+                ORDER BY score
                 """,
                 (fts_query, limit),
-            ).fetchall()
-            return [self._row_to_video(row) for row in rows]
+            )
+            return [self._row_to_video(row) for row in cursor]
 
-    def get_recent(self, limit: int = 100) -> list[Video]:
-        """Get the most recently downloaded videos."""
+    def search_summary(
+        self, query: str, limit: int = 50, *, uploader_chars: int = 15, title_chars: int = 40
+    ) -> Iterator[tuple[str, str, str, str]]:
+        """
+        Stream search hits as display-ready (platform, uploader, title, duration) rows.
+
+        Same matching and ranking as search(), but SQLite does the projection:
+        uploader/title are cut to the given widths ("?" when missing) and the
+        duration is rendered as M:SS ("" when unknown). No Video models, no
+        raw_metadata, for callers that only render a listing.
+        """
+        fts_query = _fts_prefix_query(query)
+        if fts_query is None:
+            return
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM videos
+            cursor = conn.execute(
+                f"""
+                {_FTS_HITS}
+                SELECT
+                    platform,
+                    COALESCE(NULLIF(substr(uploader, 1, ?), ''), '?'),
+                    COALESCE(NULLIF(substr(title, 1, ?), ''), '?'),
+                    CASE WHEN duration_seconds THEN printf(
+                        '%d:%02d',
+                        CAST(duration_seconds AS INTEGER) / 60,
+                        CAST(duration_seconds AS INTEGER) % 60
+                    ) ELSE '' END
+                FROM videos
+                JOIN hits ON id = hit_id
+                ORDER BY score
+                """,
+                (fts_query, limit, uploader_chars, title_chars),
+            )
+            while rows := cursor.fetchmany(SEARCH_FETCH_SIZE):
+                for row in rows:
+                    yield tuple(row)
+
+    def get_recent(self, limit: int = 100, *, raw: bool = False) -> list[Video]:
+        """Get the most recently downloaded videos (raw_metadata only when raw=True)."""
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"""
+                {select}
                 ORDER BY downloaded_at DESC
                 LIMIT ?
                 """,
                 (limit,),
-            ).fetchall()
-            return [self._row_to_video(row) for row in rows]
+            )
+            return [self._row_to_video(row) for row in cursor]
 
-    def get_by_platform(self, platform: str, limit: int = 100) -> list[Video]:
-        """Get videos from a specific platform."""
+    def get_by_platform(self, platform: str, limit: int = 100, *, raw: bool = False) -> list[Video]:
+        """Get videos from a specific platform (raw_metadata only when raw=True)."""
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM videos
+            cursor = conn.execute(
+                f"""
+                {select}
                 WHERE platform = ?
                 ORDER BY downloaded_at DESC
                 LIMIT ?
                 """,
                 (platform, limit),
-            ).fetchall()
-            return [self._row_to_video(row) for row in rows]
+            )
+            return [self._row_to_video(row) for row in cursor]
 
-    def get_by_uploader(self, uploader: str, limit: int = 100) -> list[Video]:
-        """Get videos from a specific uploader."""
+    def get_by_uploader(self, uploader: str, limit: int = 100, *, raw: bool = False) -> list[Video]:
+        """Get videos from a specific uploader (raw_metadata only when raw=True)."""
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM videos
+            cursor = conn.execute(
+                f"""
+                {select}
                 WHERE uploader = ? OR uploader_id = ?
                 ORDER BY downloaded_at DESC
                 LIMIT ?
                 """,
                 (uploader, uploader, limit),
-            ).fetchall()
-            return [self._row_to_video(row) for row in rows]
+            )
+            return [self._row_to_video(row) for row in cursor]
 
-    def get_by_collection(self, collection: str, limit: int = 100) -> list[Video]:
-        """Get videos in a specific collection."""
+    def get_by_collection(
+        self, collection: str, limit: int = 100, *, raw: bool = False
+    ) -> list[Video]:
+        """Get videos in a specific collection (raw_metadata only when raw=True)."""
+        select = VIDEO_SELECT if raw else VIDEO_LIST_SELECT
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM videos
+            cursor = conn.execute(
+                f"""
+                {select}
                 WHERE collection = ?
                 ORDER BY downloaded_at DESC
                 LIMIT ?
                 """,
                 (collection, limit),
-            ).fetchall()
-            return [self._row_to_video(row) for row in rows]
+            )
+            return [self._row_to_video(row) for row in cursor]
 
     def update_video(self, video: Video) -> None:
         """Update an existing video."""
@@ -458,7 +711,7 @@ class VideoStore:
                 WHERE id = ?
                 """,
                 (
-                    json.dumps(video.tags),
+                    _json.dumps(video.tags),
                     video.rating,
                     video.notes,
                     video.collection,
@@ -488,11 +741,15 @@ class VideoStore:
 
     def list_all_videos(self) -> list[Video]:
         """Return every video row (for doctor / path migration)."""
+        return list(self.iter_all_videos())
+
+    def iter_all_videos(self) -> Iterator[Video]:
+        """Stream every video row in id order, SCAN_FETCH_SIZE rows per fetch."""
         with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT * FROM videos ORDER BY id ASC"
-            ).fetchall()
-            return [self._row_to_video(row) for row in rows]
+            cursor = conn.execute(f"{VIDEO_SELECT} ORDER BY id ASC")
+            while rows := cursor.fetchmany(SCAN_FETCH_SIZE):
+                for row in rows:
+                    yield self._row_to_video(row)
 
     def delete_video(self, video_id: int) -> bool:
         """Delete a video from the library. Returns True if deleted."""
@@ -509,23 +766,14 @@ class VideoStore:
     def get_stats(self) -> dict:
         """Get library statistics."""
         with self._connect() as conn:
-            total = conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
-            total_size = conn.execute(
-                "SELECT COALESCE(SUM(file_size_bytes), 0) FROM videos"
-            ).fetchone()[0]
             platforms = conn.execute(
-                """
-                SELECT platform, COUNT(*) as count 
-                FROM videos 
-                GROUP BY platform 
-                ORDER BY count DESC
-                """
+                "SELECT platform, videos, size_bytes FROM platform_stats ORDER BY videos DESC"
             ).fetchall()
 
             return {
-                "total_videos": total,
-                "total_size_bytes": total_size,
-                "platforms": {row["platform"]: row["count"] for row in platforms},
+                "total_videos": sum(row["videos"] for row in platforms),
+                "total_size_bytes": sum(row["size_bytes"] for row in platforms),
+                "platforms": {row["platform"]: row["videos"] for row in platforms},
             }
 
     def get_download_rate_stats(self) -> dict:
@@ -557,36 +805,69 @@ class VideoStore:
             }
 
     def _row_to_video(self, row: sqlite3.Row) -> Video:
-        """Convert a database row to a Video model."""
-        return Video(
-            id=row["id"],
-            url=row["url"],
-            platform=row["platform"],
-            video_id=row["video_id"],
-            title=row["title"],
-            description=row["description"],
-            uploader=row["uploader"],
-            uploader_id=row["uploader_id"],
-            upload_date=datetime.fromisoformat(row["upload_date"]) if row["upload_date"] else None,
-            duration_seconds=row["duration_seconds"],
-            view_count=row["view_count"],
-            like_count=row["like_count"],
-            comment_count=row["comment_count"],
-            resolution=row["resolution"],
-            fps=row["fps"],
-            codec=row["codec"],
-            file_size_bytes=row["file_size_bytes"],
-            file_hash_sha256=row["file_hash_sha256"],
-            local_path=row["local_path"],
-            thumbnail_path=row["thumbnail_path"],
-            downloaded_at=datetime.fromisoformat(row["downloaded_at"])
-            if row["downloaded_at"]
-            else None,
-            tags=json.loads(row["tags"]) if row["tags"] else [],
-            rating=row["rating"],
-            notes=row["notes"],
-            collection=row["collection"],
-            raw_metadata=json.loads(row["raw_metadata"]) if row["raw_metadata"] else None,
+        """
+        Convert a database row (VIDEO_COLUMNS order) to a Video model.
+
+        Rows were validated on the way in and the schema enforces the rest
+        (NOT NULLs, the rating CHECK), so validation is skipped here.
+        """
+        (
+            id_,
+            url,
+            platform,
+            video_id,
+            title,
+            description,
+            uploader,
+            uploader_id,
+            upload_date,
+            duration,
+            view_count,
+            like_count,
+            comment_count,
+            resolution,
+            fps,
+            codec,
+            file_size_bytes,
+            file_hash_sha256,
+            local_path,
+            thumbnail_path,
+            downloaded_at,
+            tags,
+            rating,
+            notes,
+            collection,
+            raw_metadata,
+        ) = row
+        return Video.model_construct(
+            id=id_,
+            url=url,
+            platform=platform,
+            video_id=video_id,
+            title=title,
+            description=description,
+            uploader=uploader,
+            uploader_id=uploader_id,
+            upload_date=_fromisoformat(upload_date) if upload_date else None,
+            # INTEGER affinity hands back whole seconds as int; the model says float
+            duration_seconds=float(duration) if duration is not None else None,
+            view_count=view_count,
+            like_count=like_count,
+            comment_count=comment_count,
+            resolution=resolution,
+            fps=fps,
+            codec=codec,
+            file_size_bytes=file_size_bytes,
+            file_hash_sha256=file_hash_sha256,
+            local_path=local_path,
+            thumbnail_path=thumbnail_path,
+            downloaded_at=_fromisoformat(downloaded_at) if downloaded_at else None,
+            # Most rows carry the column default; don't run a parser for it
+            tags=_json.loads(tags) if tags and tags != "[]" else [],
+            rating=rating,
+            notes=notes,
+            collection=collection,
+            raw_metadata=_json.loads(raw_metadata) if raw_metadata else None,
         )
 
     # ========================================================================
@@ -682,17 +963,17 @@ class VideoStore:
             check_interval_minutes=row["check_interval_minutes"],
             enabled=bool(row["enabled"]),
             auto_download=bool(row["auto_download"]),
-            last_checked_at=datetime.fromisoformat(row["last_checked_at"])
+            last_checked_at=_fromisoformat(row["last_checked_at"])
             if row["last_checked_at"]
             else None,
-            last_new_content_at=datetime.fromisoformat(row["last_new_content_at"])
+            last_new_content_at=_fromisoformat(row["last_new_content_at"])
             if row["last_new_content_at"]
             else None,
             last_known_video_id=row["last_known_video_id"],
             consecutive_failures=row["consecutive_failures"],
             requires_auth=bool(row["requires_auth"]),
             cookies_browser=row["cookies_browser"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
+            created_at=_fromisoformat(row["created_at"]) if row["created_at"] else None,
         )
 
     # ========================================================================
@@ -824,9 +1105,7 @@ class VideoStore:
             eta_seconds=row["eta_seconds"],
             video_id=row["video_id"],
             error_message=row["error_message"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-            started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
-            completed_at=datetime.fromisoformat(row["completed_at"])
-            if row["completed_at"]
-            else None,
+            created_at=_fromisoformat(row["created_at"]) if row["created_at"] else None,
+            started_at=_fromisoformat(row["started_at"]) if row["started_at"] else None,
+            completed_at=_fromisoformat(row["completed_at"]) if row["completed_at"] else None,
         )
@@ -1,4 +1,3 @@
-import json
 import re
 from collections.abc import Callable
 from datetime import datetime, timedelta
@@ -6,9 +5,11 @@ from pathlib import Path
 
 import httpx
 
+from . import _json
 from .config import HEALTH_LOG_PATH
 from .db.store import VideoStore
 from .smokescreen import (
+    DEFAULT_CONCURRENCY,
     HealthResult,
     HealthStatus,
     load_health_log,
@@ -90,12 +91,12 @@ class SiteHealth:
                 if resp.status_code == 200:
                     self._matrix = self._parse_markdown(resp.text)
                     if self.store:
-                        self.store.set_metadata("cached_site_matrix", json.dumps(self._matrix))
+                        self.store.set_metadata("cached_site_matrix", _json.dumps(self._matrix))
             except Exception:
                 if self.store:
                     cached_str = self.store.get_metadata("cached_site_matrix")
                     if cached_str:
-                        self._matrix = json.loads(cached_str)
+                        self._matrix = _json.loads(cached_str)
 
             # 2. Load enriched metadata from local file first
             local_path = (
@@ -104,11 +105,10 @@ class SiteHealth:
 
             if local_path.exists():
                 try:
-                    with open(local_path) as f:
-                        self._metadata = json.load(f)
+                    self._metadata = _json.loads(local_path.read_bytes())
                     if self.store:
                         self.store.set_metadata(
-                            "cached_registry_metadata", json.dumps(self._metadata)
+                            "cached_registry_metadata", _json.dumps(self._metadata)
                         )
                 except Exception:
                     pass
@@ -121,13 +121,13 @@ class SiteHealth:
                         self._metadata = resp.json()
                         if self.store:
                             self.store.set_metadata(
-                                "cached_registry_metadata", json.dumps(self._metadata)
+                                "cached_registry_metadata", _json.dumps(self._metadata)
                             )
                 except Exception:
                     if self.store:
                         cached_str = self.store.get_metadata("cached_registry_metadata")
                         if cached_str:
-                            self._metadata = json.loads(cached_str)
+                            self._metadata = _json.loads(cached_str)
 
         # 3. Load Health Log
         self._health_log = load_health_log(self._health_log_path)
@@ -221,7 +221,7 @@ class SiteHealth:
     async def run_smokescreen(
         self,
         sites: list[str] | None = None,
-        concurrency: int = 5,
+        concurrency: int = DEFAULT_CONCURRENCY,
         proxy: str | None = None,
         tested_from: str = "local",
         on_result: Callable[[HealthResult], None] | None = None,
@@ -77,11 +77,11 @@ def export_library_json(
 
     # Get videos based on filters
     if platform:
-        videos = store.get_by_platform(platform, limit=limit or 10000)
+        videos = store.get_by_platform(platform, limit=limit or 10000, raw=include_raw)
     elif collection:
-        videos = store.get_by_collection(collection, limit=limit or 10000)
+        videos = store.get_by_collection(collection, limit=limit or 10000, raw=include_raw)
     else:
-        videos = store.get_recent(limit=limit or 10000)
+        videos = store.get_recent(limit=limit or 10000, raw=include_raw)
 
     # Convert to export format
     export_data = []
@@ -18,10 +18,10 @@ from ..config import (
     get_cookie_browser,
     get_video_output_dir,
 )
-from ..core import compute_file_hash, download, parse_upload_date
+from ..core import compute_file_hash, download, parse_upload_date, storage_metadata
 from ..db import Video, VideoStore
 from ..metadata.nfo import generate_nfo
-from ..types import ProgressDict, YtdlpInfo
+from ..types import ProgressDict
 from .export import export_video_json
 from .thumbnails import cache_thumbnail
 
@@ -209,7 +209,7 @@ async def ingest_video(
             downloaded_at=datetime.now(),
             tags=tags or [],
             collection=collection,
-            raw_metadata=_sanitize_metadata(info),
+            raw_metadata=storage_metadata(info),
         )
 
         # 10. Save to database
@@ -296,43 +296,3 @@ def ingest_video_sync(
         with concurrent.futures.ThreadPoolExecutor() as pool:
             return pool.submit(asyncio.run, coro).result()
     return asyncio.run(coro)
-
-
-def _sanitize_metadata(info: YtdlpInfo) -> YtdlpInfo:
-    """
-    Sanitize yt-dlp info dict for JSON storage.
-
-    Removes non-serializable objects and very large fields.
-    """
-    # Fields to exclude (large or non-serializable)
-    exclude_keys = {
-        "formats",  # Large list of all formats
-        "thumbnails",  # Large list of all thumbnails
-        "subtitles",  # Can be very large
-        "automatic_captions",  # Can be very large
-        "requested_downloads",  # Internal yt-dlp data
-        "requested_formats",  # Internal yt-dlp data
-        "http_headers",  # Internal
-        "_filename",  # Internal
-    }
-
-    sanitized = {}
-    for key, value in info.items():
-        if key in exclude_keys:
-            continue
-        if key.startswith("_"):
-            # Skip internal keys except our zget ones
-            if not key.startswith("_zget"):
-                continue
-
-        # Try to ensure serializable
-        try:
-            import json
-
-            json.dumps(value)
-            sanitized[key] = value
-        except (TypeError, ValueError):
-            # Skip non-serializable values
-            continue
-
-    return sanitized
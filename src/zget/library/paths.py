@@ -14,10 +14,14 @@ No network. Pure filesystem + SQLite updates via VideoStore.
 
 from __future__ import annotations
 
-import shutil
+import os
+import sqlite3
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 
 from ..config import ZGET_HOME
@@ -27,6 +31,12 @@ from ..db.store import VideoStore
 # Historical default home used by zget before custom zget_home configs.
 DEFAULT_LEGACY_HOME = Path.home() / "Downloads" / "zget"
 
+# Folders listed concurrently by existence_index (stat latency on NAS/USB mounts)
+SCAN_WORKERS = 32
+
+# Records assessed per slice when assess_library is fed a stream
+ASSESS_BATCH_SIZE = 256
+
 
 class PathStatus(str, Enum):
     """Classification of a video's stored media path."""
@@ -109,7 +119,6 @@ def try_rebase_under_home(stored: Path, legacy_home: Path, current_home: Path) -
       → /Volumes/Media/zget/videos/youtube/a.mp4
     """
     try:
-        rel = stored.resolve() if stored.exists() else stored
         # Use pure string/path prefix when file is missing (resolve may fail on missing)
         stored_abs = Path(stored).expanduser()
         if not stored_abs.is_absolute():
@@ -130,15 +139,64 @@ def try_rebase_under_home(stored: Path, legacy_home: Path, current_home: Path) -
         return None
 
 
+def _scan_names(directory: str) -> frozenset[str] | None:
+    """Entry names in directory, or None if it could not be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(e.name for e in entries if e.is_file() or e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+    except OSError:
+        return None
+
+
+class ExistenceIndex:
+    """
+    exists() check backed by one scandir per parent directory.
+
+    Library records cluster in a handful of platform folders, so listing each
+    folder once replaces a stat() per record. prefetch() lists new folders on
+    a thread pool so slow mounts overlap; any other folder (e.g. where a stale
+    path would be rebased to) is listed on first lookup. Folders that cannot
+    be read, and names missing from a listing, fall back to Path.exists() so
+    case- or normalization-insensitive volumes never report a present file
+    as missing.
+    """
+
+    def __init__(self, paths: Iterable[Path] = ()):
+        self._listings: dict[str, frozenset[str] | None] = {}
+        self.prefetch(paths)
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        folders = list({str(p.parent) for p in paths} - self._listings.keys())
+        if len(folders) > 1:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(folders))) as pool:
+                self._listings.update(zip(folders, pool.map(_scan_names, folders)))
+        else:
+            self._listings.update((d, _scan_names(d)) for d in folders)
+
+    def __call__(self, path: Path) -> bool:
+        folder = str(path.parent)
+        if folder not in self._listings:
+            self._listings[folder] = _scan_names(folder)
+        names = self._listings[folder]
+        if names is not None and path.name in names:
+            return True
+        return path.exists()
+
+
 def resolve_under_homes(
     stored: str | Path | None,
     *,
     current_home: Path | None = None,
     legacy_homes: list[Path] | None = None,
+    exists: Callable[[Path], bool] | None = None,
 ) -> tuple[Path | None, Path | None]:
     """
     Resolve a stored absolute path.
 
+    ``exists`` overrides the existence check (see ExistenceIndex).
+
     Returns:
         (resolved_existing_path, suggested_path_if_relocatable)
         - If stored exists: (stored, None)  → healthy
@@ -151,13 +209,14 @@ def resolve_under_homes(
     current = (current_home or ZGET_HOME).expanduser()
     path = Path(stored).expanduser()
 
-    if path.exists():
+    exists = exists or Path.exists
+    if exists(path):
         return path, None
 
     legacies = legacy_homes if legacy_homes is not None else default_legacy_homes()
     for legacy in legacies:
         candidate = try_rebase_under_home(path, legacy, current)
-        if candidate is not None and candidate.exists():
+        if candidate is not None and exists(candidate):
             return candidate, candidate
 
     # Last resort: same relative layout under current home even without legacy prefix match
@@ -226,6 +285,7 @@ def assess_video(
     *,
     current_home: Path | None = None,
     legacy_homes: list[Path] | None = None,
+    exists: Callable[[Path], bool] | None = None,
 ) -> PathAssessment:
     """Classify one video record's path health."""
     home = (current_home or ZGET_HOME).expanduser()
@@ -241,12 +301,12 @@ def assess_video(
 
     stored = Path(video.local_path).expanduser()
     existing, reloc = resolve_under_homes(
-        video.local_path, current_home=home, legacy_homes=legs
+        video.local_path, current_home=home, legacy_homes=legs, exists=exists
     )
 
     thumb_stored = Path(video.thumbnail_path).expanduser() if video.thumbnail_path else None
     thumb_existing, thumb_reloc = resolve_under_homes(
-        video.thumbnail_path, current_home=home, legacy_homes=legs
+        video.thumbnail_path, current_home=home, legacy_homes=legs, exists=exists
     ) if video.thumbnail_path else (None, None)
 
     if existing is not None and reloc is None:
@@ -319,16 +379,31 @@ def assess_video(
 
 
 def assess_library(
-    videos: list[Video],
+    videos: Iterable[Video],
     *,
     current_home: Path | None = None,
     legacy_homes: list[Path] | None = None,
 ) -> LibraryPathReport:
+    """
+    Classify every record. ``videos`` may be a stream (VideoStore.iter_all_videos);
+    it is consumed in ASSESS_BATCH_SIZE slices, prefetching each slice's folders.
+    """
     report = LibraryPathReport()
-    for v in videos:
-        report.assessments.append(
-            assess_video(v, current_home=current_home, legacy_homes=legacy_homes)
+    exists = ExistenceIndex()
+    videos = iter(videos)
+    while batch := list(islice(videos, ASSESS_BATCH_SIZE)):
+        exists.prefetch(
+            Path(stored).expanduser()
+            for v in batch
+            for stored in (v.local_path, v.thumbnail_path)
+            if stored
         )
+        for v in batch:
+            report.assessments.append(
+                assess_video(
+                    v, current_home=current_home, legacy_homes=legacy_homes, exists=exists
+                )
+            )
     return report
 
 
@@ -403,7 +478,16 @@ def backup_database(db_path: Path, backup_dir: Path | None = None) -> Path:
     dest_dir = Path(backup_dir) if backup_dir else db_path.parent
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / f"library.db.bak.{stamp}"
-    shutil.copy2(db_path, dest)
+    # SQLite online backup: includes pages still in the WAL, unlike a file copy
+    src = sqlite3.connect(db_path)
+    try:
+        dst = sqlite3.connect(dest)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
     return dest
 
 
@@ -434,8 +518,9 @@ def rewrite_stale_paths(
 
     Returns (report, plans, backup_path_or_None).
     """
-    videos = store.list_all_videos()
-    report = assess_library(videos, current_home=current_home, legacy_homes=legacy_homes)
+    report = assess_library(
+        store.iter_all_videos(), current_home=current_home, legacy_homes=legacy_homes
+    )
     plans = plan_rewrites(
         report, current_home=current_home, legacy_homes=legacy_homes
     )
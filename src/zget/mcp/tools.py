@@ -5,6 +5,7 @@ Each tool is an async method that interfaces with zget's core functionality.
 """
 
 import asyncio
+from functools import cached_property
 from pathlib import Path
 
 from ..config import DB_PATH
@@ -18,15 +19,10 @@ class ZgetTools:
     Provides async wrappers around zget's core functionality for agent access.
     """
 
-    def __init__(self):
-        self._store: VideoStore | None = None
-
-    @property
+    @cached_property
     def store(self) -> VideoStore:
-        """Lazy-load the video store."""
-        if self._store is None:
-            self._store = VideoStore(DB_PATH)
-        return self._store
+        """Lazy-load the video store; later accesses are a plain attribute read."""
+        return VideoStore(DB_PATH)
 
     async def search(self, query: str, limit: int = 20) -> dict:
         """
@@ -66,7 +62,7 @@ class ZgetTools:
         Returns:
             Full video metadata dict
         """
-        video = self.store.get_video(video_id)
+        video = self.store.get_video(video_id, raw=False)
         if not video:
             return {"error": f"Video {video_id} not found"}
 
@@ -106,7 +102,7 @@ class ZgetTools:
         Returns:
             Dict with 'path' and existence check
         """
-        video = self.store.get_video(video_id)
+        video = self.store.get_video(video_id, raw=False)
         if not video:
             return {"error": f"Video {video_id} not found"}
 
@@ -217,7 +213,7 @@ class ZgetTools:
         Returns:
             Dict indicating if URL exists and video info if found
         """
-        video = self.store.get_video_by_url(url)
+        video = self.store.get_video_by_url(url, raw=False)
         if video:
             return {
                 "exists": True,
@@ -67,6 +67,8 @@ _OG_TITLE_RE = re.compile(
 )
 _TITLE_TAG_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
 _PROGRAM_DOT_RE = re.compile(r"program\.(\d{5,})", re.IGNORECASE)
+# Page-title suffixes, lowercased, most specific first
+_TITLE_SUFFIXES = (" | c-span.org", " | c-span", " - c-span", " | cspan", " | video")
 
 
 @dataclass
@@ -176,8 +178,9 @@ def _cdn_fallback_urls(program_id: str) -> list[str]:
 def _clean_cspan_title(title: str) -> str:
     """Strip common C-SPAN site suffixes from page titles."""
     title = title.strip()
-    for sep in (" | C-SPAN.org", " | C-SPAN", " - C-SPAN", " | CSPAN", " | Video"):
-        idx = title.lower().find(sep.lower())
+    lowered = title.lower()
+    for sep in _TITLE_SUFFIXES:
+        idx = lowered.find(sep)
         if idx > 0:
             return title[:idx].strip()
     return title
@@ -52,6 +52,9 @@ class HealthResult:
         }
 
 
+# Max yt-dlp --simulate probes in flight during a batch verification
+DEFAULT_CONCURRENCY = 16
+
 # Common geo-blocking error patterns
 GEO_BLOCK_PATTERNS = [
     "not available in your country",
@@ -205,7 +208,7 @@ async def verify_site(
 
 async def verify_sites_batch(
     sites: list[dict[str, str]],
-    concurrency: int = 5,
+    concurrency: int = DEFAULT_CONCURRENCY,
     proxy: str | None = None,
     tested_from: str = "local",
     on_result: Callable[[HealthResult], None] | None = None,
@@ -233,9 +236,10 @@ async def verify_sites_batch(
                 proxy=proxy,
                 tested_from=tested_from,
             )
-            if on_result:
-                on_result(result)
-            return result
+        # Report outside the semaphore so a slow renderer never holds a probe slot
+        if on_result:
+            on_result(result)
+        return result
 
     tasks = [verify_with_semaphore(site) for site in sites]
     results = await asyncio.gather(*tasks)
@@ -7,10 +7,19 @@ Common helpers used across multiple modules.
 import mimetypes
 import re
 import unicodedata
+from functools import lru_cache
 
+# sanitize_filename: every ASCII char outside [A-Za-z0-9_-] becomes a space
+# (the input is ASCII by then, so a translate table does the job of [^\w-])
+_NON_SLUG_TO_SPACE = {
+    code: " " for code in range(128) if not (chr(code).isalnum() or chr(code) in "_-")
+}
+_SEPARATOR_RUNS = re.compile(r"[\s_.-]+")
 
+
+@lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get the package version from installed metadata."""
+    """Get the package version from installed metadata (read once per process)."""
     try:
         from importlib.metadata import version
 
@@ -26,9 +35,9 @@ def sanitize_filename(name: str, max_length: int = 100) -> str:
     # Remove non-ascii characters (emojis, etc)
     name = name.encode("ascii", "ignore").decode("ascii")
     # Replace anything not alphanumeric or hyphen with space
-    name = re.sub(r"[^\w-]", " ", name)
+    name = name.translate(_NON_SLUG_TO_SPACE)
     # Replace multiple spaces/underscores/dots with single underscore, lowercase
-    name = re.sub(r"[\s_.-]+", "_", name).strip("_").lower()
+    name = _SEPARATOR_RUNS.sub("_", name).strip("_").lower()
     # Limit length
     return name[:max_length]
 
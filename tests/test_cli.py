@@ -0,0 +1,54 @@
+"""Tests for CLI argument handling (no downloads, no network)."""
+
+from __future__ import annotations
+
+from zget import cli
+
+
+def test_build_parser_expands_short_and_long_aliases():
+    args = cli.build_parser().parse_args(["-a", "-o", "out", "-q", "720", "https://x.test/v"])
+    assert args.audio_only is True
+    assert args.output == "out"
+    assert args.quality == "720"
+    assert args.url == "https://x.test/v"
+    assert args.location == "local"
+
+
+def test_main_fast_paths_skip_the_parser(monkeypatch):
+    calls: list[tuple] = []
+    monkeypatch.setattr(cli, "build_parser", lambda: (_ for _ in ()).throw(AssertionError))
+    monkeypatch.setattr(cli, "handle_stats", lambda: calls.append(("stats",)))
+    monkeypatch.setattr(cli, "handle_search", lambda q: calls.append(("search", q)))
+
+    monkeypatch.setattr(cli.sys, "argv", ["zget", "--stats"])
+    cli.main()
+    monkeypatch.setattr(cli.sys, "argv", ["zget", "--search", "hearing"])
+    cli.main()
+
+    assert calls == [("stats",), ("search", "hearing")]
+
+
+def test_parse_switches_matches_argparse():
+    for argv in ([], ["--stats"], ["--doctor", "--fix", "--dry-run"], ["--health", "-a"]):
+        assert cli._parse_switches(argv) == cli.build_parser().parse_args(argv)
+
+    assert cli._parse_switches(["--help"]) is None
+    assert cli._parse_switches(["-o", "out"]) is None
+    assert cli._parse_switches(["https://x.test/v", "--quiet"]) is None
+
+
+def test_format_size():
+    assert cli._format_size(0) == "0 B"
+    assert cli._format_size(1023) == "1023 B"
+    assert cli._format_size(1536) == "1.5 KB"
+    assert cli._format_size(5 * (1 << 30)) == "5.0 GB"
+    assert cli._format_size(3 * (1 << 40)) == "3.0 TB"
+    assert cli._format_size(512, min_unit=1) == "0.5 KB"
+    assert cli._format_size(10 * (1 << 10), min_unit=2) == "0.0 MB"
+
+
+def test_ellipsis():
+    assert cli._ellipsis(None, 5) == "?"
+    assert cli._ellipsis("", 5) == "?"
+    assert cli._ellipsis("abcde", 5) == "abcde"
+    assert cli._ellipsis("abcdef", 5) == "abcde..."
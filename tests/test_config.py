@@ -0,0 +1,112 @@
+"""Tests for persistent config loading and platform detection."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from zget import config
+
+
+def test_load_persistent_config_tracks_file_changes(tmp_path: Path, monkeypatch):
+    cfg = tmp_path / "config.json"
+    monkeypatch.setattr(config, "CONFIG_FILE", cfg)
+
+    assert config.load_persistent_config() == {}
+    cfg.write_text("")
+    assert config.load_persistent_config() == {}
+
+    cfg.write_text(json.dumps({"flat_output": True}))
+    loaded = config.load_persistent_config()
+    assert loaded == {"flat_output": True}
+    loaded["flat_output"] = False  # callers get a copy, not the cached dict
+    assert config.load_persistent_config() == {"flat_output": True}
+
+    cfg.write_text(json.dumps({"zget_home": "/srv/zget"}))
+    st = cfg.stat()
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert config.load_persistent_config() == {"zget_home": "/srv/zget"}
+
+
+def test_read_persistent_config_reuses_the_parse(tmp_path: Path, monkeypatch):
+    cfg = tmp_path / "config.json"
+    monkeypatch.setattr(config, "CONFIG_FILE", cfg)
+    cfg.write_text(json.dumps({"output_dir": "/media"}))
+
+    parses = []
+    real_loads = config._json.loads
+    monkeypatch.setattr(config._json, "loads", lambda data: parses.append(data) or real_loads(data))
+
+    assert config.load_persistent_config() == {"output_dir": "/media"}
+    assert config.read_persistent_config() == {"output_dir": "/media"}
+    assert len(parses) == 1
+
+    cfg.write_text("{not json")
+    assert config.load_persistent_config() == {}
+    with pytest.raises(ValueError):
+        config.read_persistent_config()
+
+
+def test_ensure_directories(tmp_path: Path, monkeypatch):
+    home = tmp_path / "zget"
+    monkeypatch.setattr(config, "ZGET_HOME", home)
+    for name in ("videos", "thumbnails", "exports", "logs"):
+        monkeypatch.setattr(config, f"{name.upper()}_DIR", home / name)
+
+    config.ensure_directories()
+    assert sorted(p.name for p in home.iterdir()) == ["exports", "logs", "thumbnails", "videos"]
+
+    (home / "logs").rmdir()
+    config.ensure_directories()
+    assert (home / "logs").is_dir()
+
+
+def test_get_video_output_dir_follows_flat_toggle(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(config, "CUSTOM_OUTPUT_DIR", None)
+    monkeypatch.setattr(config, "VIDEOS_DIR", tmp_path / "videos")
+    monkeypatch.setattr(config, "FLAT_OUTPUT_STRUCTURE", False)
+    assert config.get_video_output_dir("youtube") == tmp_path / "videos" / "youtube"
+    assert (tmp_path / "videos" / "youtube").is_dir()
+
+    monkeypatch.setattr(config, "FLAT_OUTPUT_STRUCTURE", True)
+    assert config.get_video_output_dir("youtube") == tmp_path / "videos"
+
+
+def test_browser_settings_skip_detection_when_configured(monkeypatch):
+    def no_detection():
+        raise AssertionError("browser detection should not run")
+
+    monkeypatch.setattr(config, "PERSISTENT_CONFIG", {"cookie_browser": "brave"})
+    monkeypatch.setenv("ZGET_BROWSER_APP", "firefox")
+    assert config._env_or_config("ZGET_BROWSER_APP", "browser_app", no_detection) == "firefox"
+    assert config._env_or_config("ZGET_UNSET_VAR", "cookie_browser", no_detection) == "brave"
+    assert config._env_or_config("ZGET_UNSET_VAR", "browser_app", lambda: "default") == "default"
+
+
+def test_get_cookie_browser_uses_module_global(monkeypatch):
+    monkeypatch.setattr(config, "DEFAULT_COOKIE_BROWSER", "safari", raising=False)
+    monkeypatch.setattr(config, "PLATFORM_COOKIE_BROWSERS", {"tiktok": "brave"})
+    monkeypatch.setattr(config, "_env_or_config", lambda *a: "not-consulted")
+    assert config.get_cookie_browser("youtube") == "safari"
+    assert config.get_cookie_browser("tiktok") == "brave"
+
+
+def test_detect_platform():
+    assert config.detect_platform("https://www.youtube.com/watch?v=abc") == "youtube"
+    assert config.detect_platform("https://youtu.be/abc") == "youtube"
+    assert config.detect_platform("https://x.com/user/status/1") == "twitter"
+    # domain boundary: "t.co" must not match inside "combatfootage"
+    assert config.detect_platform("https://www.reddit.com/r/combatfootage/") == "reddit"
+    assert config.detect_platform("https://example.org/v.mp4") == "other"
+
+
+def test_detect_platform_matches_host_only():
+    assert config.detect_platform("https://vm.tiktok.com/ZM123/") == "tiktok"
+    assert config.detect_platform("https://www.c-span.org/program/x/674647") == "c-span"
+    assert config.detect_platform("youtube.com/watch?v=abc") == "youtube"
+    assert config.detect_platform("https://WWW.YouTube.com:443/watch") == "youtube"
+    assert config.detect_platform("https://www.netflix.com/title/1") == "other"
+    assert config.detect_platform("https://example.org/share/youtube.com/") == "other"
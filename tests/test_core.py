@@ -0,0 +1,287 @@
+"""Tests for core helpers that do not touch the network."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import yt_dlp
+
+from zget import core
+from zget.core import HASH_CHUNK_SIZE, compute_file_hash, parse_upload_date
+
+
+def test_compute_file_hash_matches_hashlib(tmp_path: Path):
+    media = tmp_path / "clip.mp4"
+    data = b"\x00\x01zget" * (HASH_CHUNK_SIZE // 3)  # spans several read chunks
+    media.write_bytes(data)
+
+    assert compute_file_hash(media) == hashlib.sha256(data).hexdigest()
+    assert compute_file_hash(str(media), algorithm="md5") == hashlib.md5(data).hexdigest()
+
+
+def test_compute_file_hash_empty_file(tmp_path: Path):
+    media = tmp_path / "empty.mp4"
+    media.write_bytes(b"")
+    assert compute_file_hash(media) == hashlib.sha256(b"").hexdigest()
+
+
+def test_compute_file_hashes(tmp_path: Path):
+    paths = []
+    for n in range(5):
+        media = tmp_path / f"clip{n}.mp4"
+        media.write_bytes(b"zget" * (n + 1))
+        paths.append(media)
+
+    assert core.compute_file_hashes(paths, max_workers=2) == {
+        p: hashlib.sha256(p.read_bytes()).hexdigest() for p in paths
+    }
+    with pytest.raises(FileNotFoundError):
+        core.compute_file_hashes([*paths, tmp_path / "missing.mp4"])
+
+
+def test_parse_upload_date():
+    assert parse_upload_date("20260709") == datetime(2026, 7, 9)
+    assert parse_upload_date("20261340") is None  # impossible month/day
+    assert parse_upload_date("2026-07-09") is None
+    assert parse_upload_date("") is None
+    assert parse_upload_date(None) is None
+
+
+def test_compute_file_hash_without_file_digest(tmp_path: Path, monkeypatch):
+    media = tmp_path / "clip.mp4"
+    data = b"zget" * (HASH_CHUNK_SIZE // 3)  # last chunk is partial
+    media.write_bytes(data)
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+    assert compute_file_hash(media) == hashlib.sha256(data).hexdigest()
+
+
+def test_compute_file_hash_blake3_needs_the_package(tmp_path: Path, monkeypatch):
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"zget")
+    monkeypatch.setattr(core, "blake3", None)
+
+    with pytest.raises(ValueError, match="blake3"):
+        compute_file_hash(media, algorithm="blake3")
+
+
+class _FakeYDL:
+    extractions: list[str] = []
+    opts: dict = {}
+
+    def __init__(self, opts):
+        _FakeYDL.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def extract_info(self, url, download=False):
+        self.extractions.append(url)
+        return {"id": "abc", "title": "Clip", "formats": [{"format_id": "18", "height": 360}]}
+
+    def process_ie_result(self, info, download=False):
+        self.extractions.append("reused")
+        return info
+
+    def prepare_filename(self, info):
+        return "Clip.mp4"
+
+
+def test_extract_info_reuses_recent_results(monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYDL)
+    monkeypatch.setattr(_FakeYDL, "extractions", [])
+    monkeypatch.setattr(core, "_info_cache", {})
+    url = "https://www.youtube.com/watch?v=abc"
+
+    first = core.extract_info(url, cookies_file="cookies.txt")
+    first["title"] = "changed by caller"
+    assert core.list_formats(url, cookies_file="cookies.txt")[0]["format_id"] == "18"
+    assert core.extract_info(url, cookies_file="cookies.txt", cache=True)["title"] == "Clip"
+    assert _FakeYDL.extractions == [url]
+
+    core.extract_info(url, cookies_file="cookies.txt")  # uncached by default
+    core.extract_info(url, cookies_file="other.txt", cache=True)
+    assert _FakeYDL.extractions == [url, url, url]
+
+    monkeypatch.setattr(core, "INFO_CACHE_TTL", -1.0)
+    core.extract_info(url, cookies_file="cookies.txt")
+    core.extract_info(url, cookies_file="cookies.txt", cache=True)
+    assert len(_FakeYDL.extractions) == 5
+
+
+def test_sanitize_info_keeps_json_and_stringifies_the_rest():
+    info = {
+        "title": "Clip",
+        "formats": [{"format_id": "18", "height": 360, "fragments": None}],
+        "duration": 12.5,
+        "_type": "video",
+        "_zget_platform": "youtube",
+        "__postprocessors": [object()],
+        3: (1, 2),
+        "uploader": {"name": "C-SPAN", "verified": True},
+    }
+
+    assert core._sanitize_info(info) == {
+        "title": "Clip",
+        "formats": [{"format_id": "18", "height": 360, "fragments": None}],
+        "duration": 12.5,
+        "_zget_platform": "youtube",
+        "3": "(1, 2)",
+        "uploader": {"name": "C-SPAN", "verified": True},
+    }
+
+
+def test_download_hands_http_to_aria2c_when_enabled(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYDL)
+    monkeypatch.setattr(core, "_aria2c_available", lambda: True)
+    url = "https://www.youtube.com/watch?v=abc"
+
+    monkeypatch.setattr(core, "USE_ARIA2C", False)
+    core.download(url, output_dir=tmp_path, cookies_file="cookies.txt", quiet=True)
+    assert "external_downloader" not in _FakeYDL.opts
+
+    monkeypatch.setattr(core, "USE_ARIA2C", True)
+    core.download(url, output_dir=tmp_path, cookies_file="cookies.txt", quiet=True)
+    assert _FakeYDL.opts["external_downloader"] == {"http": "aria2c"}
+    assert _FakeYDL.opts["external_downloader_args"] == {"aria2c": core.ARIA2C_ARGS}
+
+
+class _ChattyYDL(_FakeYDL):
+    """Fires a progress hook per 1 KiB chunk, as yt-dlp does on fast links."""
+
+    def extract_info(self, url, download=False):
+        (hook,) = self.opts["progress_hooks"]
+        for done in range(1024, 100 * 1024 + 1, 1024):
+            hook({"status": "downloading", "downloaded_bytes": done, "total_bytes": 100 * 1024})
+        hook({"status": "finished", "filename": "Clip.mp4", "total_bytes": 100 * 1024})
+        return super().extract_info(url, download)
+
+
+def test_download_coalesces_progress_callbacks(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _ChattyYDL)
+    updates = []
+    core.download(
+        "https://www.youtube.com/watch?v=abc",
+        output_dir=tmp_path,
+        cookies_file="cookies.txt",
+        progress_callback=updates.append,
+        quiet=True,
+    )
+
+    # first chunk, the completing chunk, and "finished"; the 98 in between are dropped
+    assert [(u["status"], u["downloaded_bytes"]) for u in updates] == [
+        ("downloading", 1024),
+        ("downloading", 100 * 1024),
+        ("finished", 0),
+    ]
+
+
+def test_storage_metadata_drops_bulky_and_private_keys():
+    info = {
+        "id": "abc",
+        "title": "Clip",
+        "formats": [{"format_id": "18"}],
+        "automatic_captions": {"en": []},
+        "_filename": "Clip.mp4",
+        "_zget_platform": "youtube",
+    }
+    assert core.storage_metadata(info) == {
+        "id": "abc",
+        "title": "Clip",
+        "_zget_platform": "youtube",
+    }
+
+
+def test_download_with_format_id_reuses_the_extraction(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYDL)
+    monkeypatch.setattr(_FakeYDL, "extractions", [])
+    monkeypatch.setattr(core, "_info_cache", {})
+    url = "https://www.youtube.com/watch?v=abc"
+
+    core.list_formats(url, cookies_file="cookies.txt")
+    core.download(url, output_dir=tmp_path, format_id="18", cookies_file="cookies.txt")
+    assert _FakeYDL.extractions == [url, "reused"]
+    assert _FakeYDL.opts["format"] == "18"
+
+    core.download(url, output_dir=tmp_path, cookies_file="cookies.txt")  # no format_id
+    assert _FakeYDL.extractions == [url, "reused", url]
+
+
+class _PrivateKeysYDL(_FakeYDL):
+    def extract_info(self, url, download=False):
+        info = super().extract_info(url, download)
+        info["_has_drm"] = False
+        info["_format_sort_fields"] = ("res",)
+        return info
+
+    def process_ie_result(self, info, download=False):
+        _PrivateKeysYDL.processed = info
+        return super().process_ie_result(info, download)
+
+
+def test_download_reuses_the_raw_extraction(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _PrivateKeysYDL)
+    monkeypatch.setattr(_FakeYDL, "extractions", [])
+    monkeypatch.setattr(core, "_info_cache", {})
+    url = "https://www.youtube.com/watch?v=abc"
+
+    info = core.extract_info(url)
+    assert "_has_drm" not in info
+    core.download(url, output_dir=tmp_path, format_id="18")
+    assert _PrivateKeysYDL.processed["_format_sort_fields"] == ("res",)
+    assert _PrivateKeysYDL.processed["_has_drm"] is False
+
+
+class _ChannelYDL(_FakeYDL):
+    def extract_info(self, url, download=False):
+        return {
+            "uploader": "C-SPAN",
+            "entries": [
+                {"id": "a", "title": "Old", "upload_date": "20250101", "url": "https://x.com/a"},
+                None,
+                {"id": "b", "title": "New", "upload_date": "20260301", "url": "https://x.com/b"},
+                {"id": "c", "title": "Undated", "url": "https://x.com/c"},
+            ],
+        }
+
+
+def test_get_recent_videos_from_channel_filters_by_date(monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _ChannelYDL)
+
+    videos = core.get_recent_videos_from_channel("https://x.com/cspan", since="2026-01-01")
+
+    assert [(v["id"], v["upload_date"], v["uploader"]) for v in videos] == [
+        ("b", "20260301", "C-SPAN"),
+        ("c", None, "C-SPAN"),
+    ]
+
+
+def test_download_drops_the_unchosen_formats(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYDL)
+    url = "https://www.youtube.com/watch?v=abc"
+
+    result = core.download(url, output_dir=tmp_path, cookies_file="cookies.txt")
+    assert "formats" not in result
+    assert result["title"] == "Clip"
+
+    result = core.download(url, output_dir=tmp_path, cookies_file="cookies.txt", keep_formats=True)
+    assert result["formats"] == [{"format_id": "18", "height": 360}]
+
+
+def test_drop_bulky_info_strips_fragments():
+    info = {
+        "id": "abc",
+        "heatmap": [{"start_time": 0}],
+        "requested_formats": [{"format_id": "137", "fragments": [{"url": "f1"}]}],
+    }
+    assert core._drop_bulky_info(info) == {
+        "id": "abc",
+        "requested_formats": [{"format_id": "137"}],
+    }
+    assert "heatmap" in info  # the caller's dict is left alone
@@ -0,0 +1,18 @@
+"""Tests for zget's JSON helper."""
+
+from __future__ import annotations
+
+import json
+
+from zget import _json
+
+
+def test_loads_without_orjson(monkeypatch):
+    monkeypatch.setattr(_json, "orjson", None)
+
+    big = 2**70
+    assert _json.loads(b'{"a": [1, 2.5, null], "b": %d}' % big) == {"a": [1, 2.5, None], "b": big}
+    nan = _json.loads(json.dumps({"x": float("nan")}))["x"]
+    assert nan != nan
+    assert _json.loads('"\\ud800"') == "\ud800"  # lone surrogate: stdlib fallback
+    assert _json.loads(_json.dumps({"k": "v"})) == {"k": "v"}
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 from zget.db.models import Video
 from zget.db.store import VideoStore
 from zget.library.paths import (
+    ExistenceIndex,
     PathStatus,
     assess_library,
     assess_video,
+    backup_database,
     plan_rewrites,
     rewrite_stale_paths,
     try_rebase_under_home,
@@ -192,3 +195,53 @@ def test_sibling_volume_resolve(tmp_path: Path, monkeypatch):
     )
     assert a.status == PathStatus.RELOCATABLE
     assert a.resolved_path == new / rest
+
+
+def test_backup_database_includes_rows_held_in_wal(tmp_path: Path):
+    db = tmp_path / "library.db"
+    store = VideoStore(db)
+
+    # A reader left open keeps SQLite from checkpointing the WAL on close
+    reader = sqlite3.connect(db)
+    try:
+        reader.execute("SELECT 1 FROM videos").fetchone()
+        store.insert_video(_video())
+        backup = backup_database(db)
+    finally:
+        reader.close()
+
+    assert VideoStore(backup).count_videos() == 1
+
+
+def test_existence_index_lists_each_folder_once(tmp_path: Path, monkeypatch):
+    folder = tmp_path / "videos" / "youtube"
+    folder.mkdir(parents=True)
+    for name in ("a.mp4", "b.mp4"):
+        (folder / name).write_bytes(b"x")
+    present = [folder / "a.mp4", folder / "b.mp4"]
+    missing = [folder / "gone.mp4", tmp_path / "nope" / "c.mp4"]
+
+    exists = ExistenceIndex(present + missing)
+    real_exists = Path.exists
+    stats: list[Path] = []
+
+    def counting_exists(self):
+        stats.append(self)
+        return real_exists(self)
+
+    monkeypatch.setattr(Path, "exists", counting_exists)
+    assert [exists(p) for p in present + missing] == [True, True, False, False]
+    assert stats == missing
+
+
+def test_existence_index_confirms_listing_misses(tmp_path: Path, monkeypatch):
+    folder = tmp_path / "videos"
+    folder.mkdir()
+    stored = folder / "Caf\u00e9.mp4"
+    stored.write_bytes(b"x")
+
+    # Simulate a volume whose listing spells the name differently (NFD, case).
+    monkeypatch.setattr("zget.library.paths._scan_names", lambda d: frozenset({"CAFE\u0301.MP4"}))
+
+    assert ExistenceIndex([stored])(stored) is True
+    assert ExistenceIndex([folder / "gone.mp4"])(folder / "gone.mp4") is False
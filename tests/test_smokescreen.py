@@ -0,0 +1,41 @@
+"""Tests for batch smokescreen verification (yt-dlp probes mocked)."""
+
+from __future__ import annotations
+
+import asyncio
+
+from zget import smokescreen
+from zget.smokescreen import HealthResult, HealthStatus, verify_sites_batch
+
+
+def test_verify_sites_batch_bounds_concurrency(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_verify_site(site_id, test_url, proxy=None, tested_from="local"):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return HealthResult(
+            site=site_id,
+            status=HealthStatus.OK,
+            latency_ms=10,
+            error=None,
+            verified_at="2026-01-01T00:00:00Z",
+            test_url=test_url,
+            tested_from=tested_from,
+        )
+
+    monkeypatch.setattr(smokescreen, "verify_site", fake_verify_site)
+    sites = [{"site": f"site{i}", "test_url": f"https://example.com/{i}"} for i in range(20)]
+    reported: list[str] = []
+
+    results = asyncio.run(
+        verify_sites_batch(sites, concurrency=4, on_result=lambda r: reported.append(r.site))
+    )
+
+    assert peak == 4
+    assert [r.site for r in results] == [s["site"] for s in sites]
+    assert sorted(reported) == sorted(s["site"] for s in sites)
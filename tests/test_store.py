@@ -0,0 +1,301 @@
+"""Tests for the SQLite video store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+from zget.db.models import Video
+from zget.db.store import VideoStore
+
+
+def _video(n: int, **kwargs) -> Video:
+    defaults = dict(
+        url=f"https://example.com/v{n}",
+        platform="youtube",
+        video_id=f"id{n}",
+        title=f"Department hearing part {n}",
+        uploader="C-SPAN",
+        duration_seconds=60.0 * n,
+    )
+    defaults.update(kwargs)
+    return Video(**defaults)
+
+
+def test_search_summary_matches_search(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    for n in range(1, 4):
+        store.insert_video(_video(n))
+    store.insert_video(_video(9, title="Unrelated clip"))
+    store.insert_video(
+        _video(7, title="Department " + "x" * 60, uploader="", duration_seconds=None)
+    )
+
+    rows = list(store.search_summary("departm", limit=50))
+    videos = store.search("departm", limit=50)
+
+    def expected(v):
+        duration = ""
+        if v.duration_seconds:
+            mins, secs = divmod(int(v.duration_seconds), 60)
+            duration = f"{mins}:{secs:02d}"
+        return (v.platform, v.uploader[:15] or "?", v.title[:40] or "?", duration)
+
+    assert rows == [expected(v) for v in videos]
+    assert len(rows) == 4
+    assert ("youtube", "?", ("Department " + "x" * 60)[:40], "") in rows
+    assert list(store.search_summary("departm", limit=2)) == rows[:2]
+    assert list(store.search_summary("nothing-matches")) == []
+
+
+def test_raw_metadata_round_trips(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    raw = {
+        "id": "id1",
+        "formats": [{"format_id": "18", "height": 360, "tbr": 512.5}],
+        "requested_downloads": [{"filepath": Path("/tmp/clip.mp4")}],
+        "chapters": None,
+    }
+    video_id = store.insert_video(_video(1, raw_metadata=raw))
+
+    stored = store.get_video(video_id).raw_metadata
+    assert stored["formats"] == raw["formats"]
+    assert stored["requested_downloads"] == [{"filepath": "/tmp/clip.mp4"}]
+    assert stored["chapters"] is None
+
+
+def test_iter_all_videos_streams_in_id_order(tmp_path: Path, monkeypatch):
+    from zget.db import store as store_module
+
+    monkeypatch.setattr(store_module, "SCAN_FETCH_SIZE", 2)
+    store = VideoStore(tmp_path / "library.db")
+    ids = [store.insert_video(_video(n)) for n in range(1, 6)]
+
+    assert [v.id for v in store.iter_all_videos()] == ids
+    assert [v.id for v in store.list_all_videos()] == ids
+
+
+def test_store_reuses_one_connection_per_thread(tmp_path: Path):
+    import threading
+
+    store = VideoStore(tmp_path / "library.db")
+    conn = store._connection()
+    store.insert_video(_video(1))
+    assert store._connection() is conn
+    assert store.count_videos() == 1
+
+    other: list = []
+    worker = threading.Thread(target=lambda: other.append(store._connection()))
+    worker.start()
+    worker.join()
+    assert other[0] is not conn
+
+    store.close()
+    assert store._connection() is not conn
+    assert store.count_videos() == 1
+
+
+def _scanned_stats(store: VideoStore) -> dict:
+    with store._connect() as conn:
+        rows = conn.execute(
+            "SELECT platform, COUNT(*), COALESCE(SUM(file_size_bytes), 0) "
+            "FROM videos GROUP BY platform"
+        ).fetchall()
+    return {
+        "total_videos": sum(r[1] for r in rows),
+        "total_size_bytes": sum(r[2] for r in rows),
+        "platforms": {r[0]: r[1] for r in rows},
+    }
+
+
+def test_get_stats_tracks_inserts_updates_and_deletes(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    ids = [store.insert_video(_video(n, file_size_bytes=100 * n)) for n in range(1, 4)]
+    store.insert_video(_video(4, platform="tiktok", file_size_bytes=None))
+    store.insert_video(_video(1))  # duplicate URL: ignored, must not count
+
+    assert store.get_stats() == _scanned_stats(store)
+    assert store.get_stats()["total_size_bytes"] == 600
+
+    with store._connect() as conn:
+        conn.execute(
+            "UPDATE videos SET platform = 'vimeo', file_size_bytes = 50 WHERE id = ?", (ids[0],)
+        )
+    store.delete_video(ids[1])
+    assert store.get_stats() == _scanned_stats(store)
+    assert store.get_stats()["platforms"] == {"youtube": 1, "tiktok": 1, "vimeo": 1}
+
+
+def test_platform_stats_seeded_for_existing_library(tmp_path: Path):
+    db = tmp_path / "library.db"
+    store = VideoStore(db)
+    for n in range(1, 3):
+        store.insert_video(_video(n, file_size_bytes=10))
+    with store._connect() as conn:
+        conn.execute("DROP TABLE platform_stats")
+        conn.execute("DELETE FROM schema_version")
+        conn.execute("INSERT INTO schema_version (version) VALUES (1)")
+    store.close()
+
+    reopened = VideoStore(db)
+    assert reopened.get_stats() == {
+        "total_videos": 2,
+        "total_size_bytes": 20,
+        "platforms": {"youtube": 2},
+    }
+
+
+def test_raw_metadata_written_by_stdlib_json_still_loads(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    video_id = store.insert_video(_video(1))
+    with store._connect() as conn:
+        # Rows written before the switch may hold NaN, which orjson rejects
+        conn.execute(
+            "UPDATE videos SET raw_metadata = ? WHERE id = ?",
+            (json.dumps({"aspect_ratio": float("nan"), "id": "id1"}), video_id),
+        )
+
+    raw = store.get_video(video_id).raw_metadata
+    assert raw["id"] == "id1"
+    assert raw["aspect_ratio"] != raw["aspect_ratio"]  # NaN survives the round trip
+
+
+def test_connection_pragmas_applied_once_per_connection(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    conn = store._connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+
+def test_store_keeps_working_when_wal_is_refused(tmp_path: Path, monkeypatch):
+    real_connect = sqlite3.connect
+
+    class NoWalConnection(sqlite3.Connection):
+        def execute(self, sql, *args):
+            if sql == "PRAGMA journal_mode = WAL":
+                sql = "PRAGMA journal_mode"  # report the mode, as a refusing volume does
+            return super().execute(sql, *args)
+
+    monkeypatch.setattr(
+        sqlite3, "connect", lambda *a, **kw: real_connect(*a, factory=NoWalConnection, **kw)
+    )
+    store = VideoStore(tmp_path / "library.db")
+    conn = store._connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+    store.insert_video(_video(1))
+    assert store.count_videos() == 1
+
+
+def test_row_to_video_matches_validated_model(tmp_path: Path):
+    from datetime import datetime
+
+    store = VideoStore(tmp_path / "library.db")
+    video_id = store.insert_video(
+        _video(
+            1,
+            upload_date=datetime(2024, 5, 1),
+            downloaded_at=datetime(2024, 5, 2, 12, 30),
+            tags=["senate", "hearing"],
+            rating=4,
+            raw_metadata={"id": "id1"},
+        )
+    )
+
+    stored = store.get_video(video_id)
+    assert stored == Video.model_validate(stored.model_dump())
+    assert isinstance(stored.duration_seconds, float)
+    assert stored.upload_date == datetime(2024, 5, 1)
+    assert stored.tags == ["senate", "hearing"]
+
+
+def test_video_columns_cover_the_videos_table(tmp_path: Path):
+    from zget.db import store as store_module
+
+    store = VideoStore(tmp_path / "library.db")
+    with store._connect() as conn:
+        table_columns = [r["name"] for r in conn.execute("PRAGMA table_info(videos)")]
+    assert sorted(store_module.VIDEO_COLUMNS) == sorted(table_columns)
+
+
+def test_list_queries_leave_raw_metadata_unless_asked(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    store.insert_video(_video(1, collection="hearings", raw_metadata={"id": "id1"}))
+
+    for fetch in (
+        lambda **kw: store.get_recent(**kw),
+        lambda **kw: store.get_by_platform("youtube", **kw),
+        lambda **kw: store.get_by_uploader("C-SPAN", **kw),
+        lambda **kw: store.get_by_collection("hearings", **kw),
+        lambda **kw: store.search("departm", **kw),
+    ):
+        (listed,) = fetch()
+        assert listed.raw_metadata is None
+        assert listed.title == "Department hearing part 1"
+        (full,) = fetch(raw=True)
+        assert full.raw_metadata == {"id": "id1"}
+
+
+def test_search_ranks_before_limiting(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    for n in range(1, 6):
+        store.insert_video(_video(n, title=f"Clip {n}", description="budget"))
+    store.insert_video(_video(6, title="Budget budget budget", description="budget"))
+
+    assert [v.video_id for v in store.search("budget", limit=1)] == ["id6"]
+    assert len(store.search("budget", limit=3)) == 3
+    assert next(store.search_summary("budget", limit=1))[2] == "Budget budget budget"
+
+
+def test_filtered_listings_use_composite_indexes(tmp_path: Path):
+    from zget.db.store import VIDEO_LIST_SELECT
+
+    store = VideoStore(tmp_path / "library.db")
+    with store._connect() as conn:
+        for column in ("platform", "collection"):
+            plan = " ".join(
+                row[3]
+                for row in conn.execute(
+                    f"EXPLAIN QUERY PLAN {VIDEO_LIST_SELECT} WHERE {column} = ? "
+                    "ORDER BY downloaded_at DESC LIMIT ?",
+                    ("x", 10),
+                )
+            )
+            assert f"idx_videos_{column}_downloaded" in plan
+            assert "TEMP B-TREE" not in plan
+
+
+def test_get_videos_by_ids_batches(tmp_path: Path, monkeypatch):
+    from zget.db import store as store_module
+
+    monkeypatch.setattr(store_module, "ID_BATCH_SIZE", 2)
+    store = VideoStore(tmp_path / "library.db")
+    ids = [store.insert_video(_video(n, raw_metadata={"n": n})) for n in range(1, 6)]
+
+    found = store.get_videos_by_ids([ids[4], ids[0], 999, ids[2], ids[0]])
+    assert sorted(found) == sorted([ids[0], ids[2], ids[4]])
+    assert found[ids[2]] == store.get_video(ids[2])
+    assert store.get_videos_by_ids(ids, raw=False)[ids[1]].raw_metadata is None
+    assert store.get_videos_by_ids([]) == {}
+
+
+def test_search_escapes_quotes_and_skips_blank_queries(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    store.insert_video(_video(1, title='The "Big" Hearing'))
+
+    assert [v.video_id for v in store.search('"big')] == ["id1"]
+    assert [v.video_id for v in store.search("hear")] == ["id1"]
+    assert store.search("   ") == []
+    assert list(store.search_summary("")) == []
+
+
+def test_single_lookups_can_skip_raw_metadata(tmp_path: Path):
+    store = VideoStore(tmp_path / "library.db")
+    video_id = store.insert_video(_video(1, raw_metadata={"id": "id1"}))
+
+    assert store.get_video(video_id).raw_metadata == {"id": "id1"}
+    assert store.get_video(video_id, raw=False).raw_metadata is None
+    assert store.get_video_by_url("https://example.com/v1", raw=False).id == video_id
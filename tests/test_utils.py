@@ -0,0 +1,27 @@
+"""Tests for shared helpers."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from zget.utils import sanitize_filename
+
+
+def _regex_slug(name: str, max_length: int = 100) -> str:
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[^\w-]", " ", name)
+    return re.sub(r"[\s_.-]+", "_", name).strip("_").lower()[:max_length]
+
+
+def test_sanitize_filename_matches_the_regex_slug():
+    names = [
+        "Héllo, Wörld!.. — test__x-y",
+        "C-SPAN: Senate Hearing (2026/07/09) | Part 1?",
+        'tabs\tand\nnewlines <>:"/\\|?*',
+        "🎬 emoji only 🎬",
+        "",
+    ]
+    for name in names:
+        assert sanitize_filename(name) == _regex_slug(name)
+    assert sanitize_filename("a" * 300, max_length=10) == "a" * 10